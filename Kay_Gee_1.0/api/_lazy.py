@@ -0,0 +1,67 @@
+"""
+KayGee 1.0 - Lazy manager namespace
+Defers importing the full cognitive system until a manager is first used (PEP 562)
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+_SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Managers loaded directly from file to avoid package confusion
+# (src/perception.py vs the src/perception/ package, etc.)
+_FILE_MODULES = {
+    "ReasoningManager": ("reasoning", "reasoning_manager.py"),
+    "PerceptionManager": ("perception", "perception.py"),
+    "ArticulationManager": ("articulation", "articulation.py"),
+    "IntegrityManager": ("integrity", "integrity.py"),
+    "PruningEngine": ("pruning", "pruning.py"),
+    "SKGHealthMonitor": ("health_monitor", "health_monitor.py"),
+}
+
+# Components that import cleanly as regular package modules
+_PACKAGE_MODULES = {
+    "HandshakeProtocol": "src.handshake.manager",
+    "VaultManager": "src.vaults",
+    "TemporalContextLayer": "src.temporal.context",
+    "MetaCognitiveMonitor": "src.meta.cognition",
+}
+
+__all__ = sorted([*_FILE_MODULES, *_PACKAGE_MODULES])
+
+
+def _load_file_module(name: str, path: Path):
+    """Execute a source file as module `name`, registered in sys.modules so it runs once"""
+    existing = sys.modules.get(name)
+    if existing is not None and getattr(existing, "__file__", None) == str(path):
+        return existing
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def __getattr__(name: str):
+    """Import the requested component on first access and cache it"""
+    if name in _FILE_MODULES:
+        module_name, filename = _FILE_MODULES[name]
+        module = _load_file_module(module_name, _SRC_DIR / filename)
+    elif name in _PACKAGE_MODULES:
+        module = importlib.import_module(_PACKAGE_MODULES[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,14 +3,20 @@ KayGee 1.0 - FastAPI Backend
 Real-time system monitoring and voice interaction
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 import asyncio
+import importlib.util
 import json
+import logging
 import time
-from typing import Optional, Dict, Any
+import orjson
+from functools import lru_cache
+from typing import Optional, Dict, Any, Set
 import sys
 import os
 from pathlib import Path
@@ -18,84 +24,24 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+logger = logging.getLogger(__name__)
+
+# Process start, used for the session identifier
+_START_NS = time.time_ns()
+
 # Determine whether to enable the full KayGee system at startup.
 # To keep the API responsive during local development (and avoid importing
 # heavy ML dependencies such as scikit-learn/scipy/torch), default to
 # fallback mode. Install optional dependencies and set an explicit flag
 # if you want the full system loaded.
 _load_full = os.getenv("KAYGEE_LOAD_FULL", "0").lower() in ("1", "true", "yes", "y")
-if _load_full:
-    try:
-        # Import components directly to avoid circular imports
-        from src.handshake.manager import HandshakeProtocol
-        from src.vaults import VaultManager
-
-        # Import ReasoningManager directly from file to avoid package confusion
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "reasoning",
-            str(Path(__file__).parent.parent / "src" / "reasoning.py")
-        )
-        reasoning_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(reasoning_module)
-        ReasoningManager = reasoning_module.ReasoningManager
-
-        # Import PerceptionManager
-        spec_perception = importlib.util.spec_from_file_location(
-            "perception",
-            str(Path(__file__).parent.parent / "src" / "perception.py")
-        )
-        perception_module = importlib.util.module_from_spec(spec_perception)
-        spec_perception.loader.exec_module(perception_module)
-        PerceptionManager = perception_module.PerceptionManager
-
-        # Import ArticulationManager
-        spec_articulation = importlib.util.spec_from_file_location(
-            "articulation",
-            str(Path(__file__).parent.parent / "src" / "articulation.py")
-        )
-        articulation_module = importlib.util.module_from_spec(spec_articulation)
-        spec_articulation.loader.exec_module(articulation_module)
-        ArticulationManager = articulation_module.ArticulationManager
-
-        # Import IntegrityManager
-        spec_integrity = importlib.util.spec_from_file_location(
-            "integrity",
-            str(Path(__file__).parent.parent / "src" / "integrity.py")
-        )
-        integrity_module = importlib.util.module_from_spec(spec_integrity)
-        spec_integrity.loader.exec_module(integrity_module)
-        IntegrityManager = integrity_module.IntegrityManager
-
-        # Import PruningEngine
-        spec_pruning = importlib.util.spec_from_file_location(
-            "pruning",
-            str(Path(__file__).parent.parent / "src" / "pruning.py")
-        )
-        pruning_module = importlib.util.module_from_spec(spec_pruning)
-        spec_pruning.loader.exec_module(pruning_module)
-        PruningEngine = pruning_module.PruningEngine
-
-        # Import SKGHealthMonitor
-        spec_health = importlib.util.spec_from_file_location(
-            "health_monitor",
-            str(Path(__file__).parent.parent / "src" / "health_monitor.py")
-        )
-        health_module = importlib.util.module_from_spec(spec_health)
-        spec_health.loader.exec_module(health_module)
-        SKGHealthMonitor = health_module.SKGHealthMonitor
 
-        from src.temporal.context import TemporalContextLayer
-        from src.meta.cognition import MetaCognitiveMonitor
+# Heavy managers are resolved lazily on first use so IO-only endpoints
+# (/health, /api/resonance/status, /visualization/space_field) never pay
+# for the torch/scipy/sklearn import chain.
+from api import _lazy as managers
 
-        SYSTEM_AVAILABLE = True
-        print("Notice: KAYGEE_LOAD_FULL=1 set — attempted to load full cognitive system.")
-    except Exception as e:
-        print(f"Warning: Full system import failed: {e}. Running in fallback mode.")
-        SYSTEM_AVAILABLE = False
-else:
-    SYSTEM_AVAILABLE = False
-    print("Notice: Running in fallback mode. To enable full system, set env var KAYGEE_LOAD_FULL=1 and install optional dependencies.")
+SYSTEM_AVAILABLE = _load_full
 
 # Fallback simple system if full system not available
 class SimpleKayGeeSystem:
@@ -113,7 +59,7 @@ class SimpleKayGeeSystem:
             "timestamp": time.time()
         }
 
-app = FastAPI(title="KayGee 1.0 API", version="1.0.0")
+app = FastAPI(title="KayGee 1.0 API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS for React frontend
 app.add_middleware(
@@ -122,66 +68,76 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Metrics", "X-Timestamp"],  # space field SVG metadata
 )
 
 # Simple system class to avoid circular imports
 class KayGeeSystem:
     def __init__(self):
+        self._initialize_components()
+        self._init_session_defaults()
+
+    def _initialize_components(self):
         if SYSTEM_AVAILABLE:
-            self.handshake_protocol = HandshakeProtocol()
+            self.handshake_protocol = managers.HandshakeProtocol()
             config = {'handshake_protocol': self.handshake_protocol}
             
             # Initialize managers
-            self.vaults = VaultManager()
-            self.reasoning_mgr = ReasoningManager()
-            self.perception_mgr = PerceptionManager()
-            self.articulation_mgr = ArticulationManager()
-            self.integrity_mgr = IntegrityManager()
+            self.vaults = managers.VaultManager()
+            self.reasoning_mgr = managers.ReasoningManager()
+            self.perception_mgr = managers.PerceptionManager()
+            self.articulation_mgr = managers.ArticulationManager()
+            self.integrity_mgr = managers.IntegrityManager()
             
-            managers = [self.vaults, self.reasoning_mgr, self.perception_mgr, 
-                       self.articulation_mgr, self.integrity_mgr]
+            core_managers = [self.vaults, self.reasoning_mgr, self.perception_mgr, 
+                            self.articulation_mgr, self.integrity_mgr]
             
             # Initialize managers defensively; fall back if any fail
             failed_managers = []
-            for manager in managers:
+            for manager in core_managers:
                 try:
                     ok = manager.initialize(config)
                 except Exception as e:
-                    print(f"Error initializing {getattr(manager, 'name', type(manager).__name__)}: {e}")
+                    logger.error("Error initializing %s: %s", getattr(manager, 'name', type(manager).__name__), e)
                     ok = False
                 if not ok:
                     failed_managers.append(getattr(manager, 'name', type(manager).__name__))
 
             if failed_managers:
-                print(f"⚠️  Failed to initialize managers: {failed_managers}. Falling back to SimpleKayGeeSystem.")
+                logger.warning("⚠️  Failed to initialize managers: %s. Falling back to SimpleKayGeeSystem.", failed_managers)
                 self.fallback_system = SimpleKayGeeSystem()
                 self.full_system = False
                 return
 
             # Initialize other components
             try:
-                self.pruning_engine = PruningEngine(self.vaults)
-                self.skg_health_monitor = SKGHealthMonitor(self.vaults, self.reasoning_mgr, self.pruning_engine)
-                self.temporal = TemporalContextLayer()
-                self.metacognition = MetaCognitiveMonitor()
+                self.pruning_engine = managers.PruningEngine(self.vaults)
+                self.skg_health_monitor = managers.SKGHealthMonitor(self.vaults, self.reasoning_mgr, self.pruning_engine)
+                self.temporal = managers.TemporalContextLayer()
+                self.metacognition = managers.MetaCognitiveMonitor()
             except Exception as e:
-                print(f"⚠️  Failed to initialize auxiliary components: {e}. Falling back to SimpleKayGeeSystem.")
+                logger.warning("⚠️  Failed to initialize auxiliary components: %s. Falling back to SimpleKayGeeSystem.", e)
                 self.fallback_system = SimpleKayGeeSystem()
                 self.full_system = False
                 return
 
-            self.session_id = f"api_session_{int(time.time())}"
+            self.session_id = f"api_session_{_START_NS // 1_000_000_000}"
             self.interaction_count = 0
             try:
                 self.temporal.initialize_session(self.session_id)
             except Exception as e:
-                print(f"Warning: temporal session initialization failed: {e}")
+                logger.warning("Temporal session initialization failed: %s", e)
             self.full_system = True
         else:
             # Use fallback system
             self.fallback_system = SimpleKayGeeSystem()
             self.full_system = False
     
+    def _init_session_defaults(self):
+        """Session fields exist in every mode; optional components (vaults) stay live lookups"""
+        self.session_id = getattr(self, 'session_id', 'unknown')
+        self.interaction_count = getattr(self, 'interaction_count', 0)
+
     def process_interaction(self, user_input: str, context=None):
         """Process interaction using managers"""
         if self.full_system:
@@ -228,7 +184,22 @@ class KayGeeSystem:
 
 # Global system instance
 kaygee_system: Optional[KayGeeSystem] = None
-connected_clients = []
+connected_clients: Set[WebSocket] = set()
+_broadcast_task: Optional[asyncio.Task] = None
+
+# Set after each interaction; the broadcast loop otherwise only sends a heartbeat.
+# Created in startup_event so it belongs to the serving loop (3.8/3.9 bind it at construction)
+state_changed: Optional[asyncio.Event] = None
+_HEARTBEAT_INTERVAL = 5.0
+
+# Static metric fragments, shared by reference across responses
+_BALANCE = {"kant": 25, "hume": 25, "locke": 25, "spinoza": 25}
+_OFFLINE_BALANCE = {"kant": 0, "hume": 0, "locke": 0, "spinoza": 0}
+
+def _merkle_preview(default: str) -> str:
+    """Shortened Merkle root of the live system, or `default` without a Merkle vault"""
+    merkle_vault = getattr(kaygee_system, 'merkle_vault', None)
+    return merkle_vault.get_current_root()[:16] + "..." if merkle_vault is not None else default
 
 # Pydantic models
 class InteractionRequest(BaseModel):
@@ -242,33 +213,101 @@ class InteractionResponse(BaseModel):
     merkle_root: str
     processing_time: float
 
+# Compiled once; /api/interact validates the raw body against it directly
+_REQ_ADAPTER = TypeAdapter(InteractionRequest)
+
 # Initialize system on startup
 @app.on_event("startup")
 async def startup_event():
-    global kaygee_system
+    global kaygee_system, _broadcast_task, state_changed
+    state_changed = asyncio.Event()
+    _broadcast_task = asyncio.create_task(_broadcast_loop())
     if SYSTEM_AVAILABLE:
+        logger.info("KAYGEE_LOAD_FULL=1 set — loading full cognitive system.")
         try:
-            print("🧠 Initializing KayGee system...")
+            logger.info("🧠 Initializing KayGee system...")
             kaygee_system = KayGeeSystem()
-            print("✅ System ready")
+            logger.info("✅ System ready")
         except Exception as e:
-            print(f"⚠️  Failed to initialize system: {e}")
-            import traceback
-            traceback.print_exc()
-
-# Root endpoint
-@app.get("/")
-async def root():
-    return {
+            logger.error("⚠️  Failed to initialize system: %s", e, exc_info=True)
+    else:
+        logger.info("Running in fallback mode. To enable full system, set env var KAYGEE_LOAD_FULL=1 and install optional dependencies.")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    global _broadcast_task
+    if _broadcast_task is not None:
+        _broadcast_task.cancel()
+        try:
+            await _broadcast_task
+        except asyncio.CancelledError:
+            pass
+        _broadcast_task = None
+
+# Static payloads for / and /health, pre-encoded per online state
+_ROOT_BYTES = {
+    online: orjson.dumps({
         "name": "KayGee 1.0 API",
         "version": "1.0.0",
-        "status": "online" if kaygee_system else "offline",
+        "status": "online" if online else "offline",
         "endpoints": {
             "status": "/api/status",
             "interact": "/api/interact",
             "metrics": "/api/metrics",
             "websocket": "/ws"
         }
+    })
+    for online in (True, False)
+}
+_HEALTH_BYTES = {
+    available: orjson.dumps({"status": "healthy", "system_available": available})
+    for available in (True, False)
+}
+
+# Root endpoint
+@app.get("/")
+async def root():
+    return Response(_ROOT_BYTES[kaygee_system is not None], media_type="application/json")
+
+def _build_status() -> Dict[str, Any]:
+    """Snapshot of the current session status (requires a live kaygee_system)"""
+    return {
+        "session_id": kaygee_system.session_id,
+        "interaction_count": kaygee_system.interaction_count,
+        "merkle_root": _merkle_preview("genesis"),
+        "uptime": time.time(),
+        "system_online": True
+    }
+
+def _build_metrics() -> Dict[str, Any]:
+    """Snapshot of the current reasoning metrics"""
+    if not kaygee_system:
+        return {
+            "confidence": 0.0,
+            "philosopher": "None",
+            "stability": 0.0,
+            "drift_detected": False,
+            "philosophical_balance": _OFFLINE_BALANCE
+        }
+
+    # Extract real metrics
+    confidence = 0.85
+    if hasattr(kaygee_system, 'last_decision'):
+        confidence = kaygee_system.last_decision.get('confidence', 0.85)
+    # Vaults may be attached after init, so look them up per snapshot
+    entries = getattr(getattr(kaygee_system, 'trace_vault', None), 'entries', None)
+
+    return {
+        "confidence": confidence,
+        "philosopher": "Balanced",  # TODO: Extract from reasoning history
+        "stability": 0.94,  # TODO: Extract from PersonalityCore
+        "drift_detected": False,
+        "philosophical_balance": _BALANCE,
+        "vault_stats": {
+            "episodic": len(entries) if entries is not None else 0,
+            "prototypical": 0,
+            "semantic_rules": 0
+        }
     }
 
 # System status
@@ -282,17 +321,7 @@ async def get_status():
         )
     
     try:
-        merkle_root = "genesis"
-        if hasattr(kaygee_system, 'merkle_vault'):
-            merkle_root = kaygee_system.merkle_vault.get_current_root()[:16] + "..."
-        
-        return {
-            "session_id": getattr(kaygee_system, 'session_id', 'unknown'),
-            "interaction_count": getattr(kaygee_system, 'interaction_count', 0),
-            "merkle_root": merkle_root,
-            "uptime": time.time(),
-            "system_online": True
-        }
+        return _build_status()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -300,63 +329,45 @@ async def get_status():
 @app.get("/api/metrics")
 async def get_metrics():
     """Get detailed system metrics"""
-    if not kaygee_system:
-        return {
-            "confidence": 0.0,
-            "philosopher": "None",
-            "stability": 0.0,
-            "drift_detected": False,
-            "philosophical_balance": {
-                "kant": 0,
-                "hume": 0,
-                "locke": 0,
-                "spinoza": 0
-            }
-        }
-    
     try:
-        # Extract real metrics
-        confidence = 0.85
-        if hasattr(kaygee_system, 'last_decision'):
-            confidence = kaygee_system.last_decision.get('confidence', 0.85)
-        
-        return {
-            "confidence": confidence,
-            "philosopher": "Balanced",  # TODO: Extract from reasoning history
-            "stability": 0.94,  # TODO: Extract from PersonalityCore
-            "drift_detected": False,
-            "philosophical_balance": {
-                "kant": 25,
-                "hume": 25,
-                "locke": 25,
-                "spinoza": 25
-            },
-            "vault_stats": {
-                "episodic": len(kaygee_system.trace_vault.entries) if hasattr(kaygee_system, 'trace_vault') and hasattr(kaygee_system.trace_vault, 'entries') else 0,
-                "prototypical": 0,
-                "semantic_rules": 0
-            }
-        }
+        return _build_metrics()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Process interaction
-@app.post("/api/interact", response_model=InteractionResponse)
-async def process_interaction(request: InteractionRequest):
+@app.post(
+    "/api/interact",
+    # The body is validated by hand below, so declare it for the OpenAPI schema here
+    openapi_extra={"requestBody": {
+        "content": {"application/json": {"schema": InteractionRequest.model_json_schema()}},
+        "required": True
+    }}
+)
+async def process_interaction(raw_request: Request):
     """Process user interaction through reasoning system"""
+    try:
+        request = _REQ_ADAPTER.validate_json(await raw_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
     if not kaygee_system:
         raise HTTPException(status_code=503, detail="System not available")
     
     try:
         start_time = time.time()
         
-        # Process through real system
-        response = kaygee_system.process_interaction(
+        # Process through real system off the event loop so websocket
+        # fan-out and status polls keep running during reasoning
+        response = await run_in_threadpool(
+            kaygee_system.process_interaction,
             request.text,
             context=request.context
         )
         
         processing_time = time.time() - start_time
+        state_changed.set()
         
         # Extract response data
         text = response.get('text', str(response))
@@ -364,58 +375,81 @@ async def process_interaction(request: InteractionRequest):
         basis = response.get('philosophical_basis', 'balanced reasoning')
         
         # Get current Merkle root
-        merkle_root = "pending"
-        if hasattr(kaygee_system, 'merkle_vault'):
-            merkle_root = kaygee_system.merkle_vault.get_current_root()[:16] + "..."
+        merkle_root = _merkle_preview("pending")
         
-        return InteractionResponse(
-            text=text,
-            confidence=confidence,
-            philosophical_basis=basis,
-            merkle_root=merkle_root,
-            processing_time=processing_time
-        )
+        # Plain dict matches InteractionResponse; skip re-validation on the way out
+        return ORJSONResponse({
+            "text": text,
+            "confidence": confidence,
+            "philosophical_basis": basis,
+            "merkle_root": merkle_root,
+            "processing_time": processing_time
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 # WebSocket for live updates
+def _snapshot_payload() -> str:
+    """One status/metrics update frame"""
+    # orjson encodes; keep a text frame since the dashboard JSON.parses event.data
+    return orjson.dumps({
+        "type": "update",
+        "status": _build_status(),
+        "metrics": _build_metrics(),
+        "timestamp": time.time()
+    }).decode()
+
+async def _broadcast_loop():
+    """Serialize one status/metrics snapshot per change (or heartbeat) and fan it out to all clients"""
+    while True:
+        try:
+            await asyncio.wait_for(state_changed.wait(), timeout=_HEARTBEAT_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        state_changed.clear()
+        if not kaygee_system or not connected_clients:
+            continue
+
+        try:
+            payload = _snapshot_payload()
+        except Exception as e:
+            logger.warning("Broadcast snapshot failed: %s", e)
+            continue
+
+        # Failed sends are dropped here; the client's own handler removes it on disconnect
+        await asyncio.gather(
+            *(ws.send_text(payload) for ws in tuple(connected_clients)),
+            return_exceptions=True
+        )
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time system updates"""
     await websocket.accept()
-    connected_clients.append(websocket)
+    connected_clients.add(websocket)
     
     try:
+        # Current snapshot right away; the broadcast loop only pushes on change or heartbeat
+        if kaygee_system:
+            await websocket.send_text(_snapshot_payload())
+        
+        # Updates are pushed by _broadcast_loop; just wait here for the disconnect
         while True:
-            # Send system status every second
-            if kaygee_system:
-                status = await get_status()
-                metrics = await get_metrics()
-                
-                await websocket.send_json({
-                    "type": "update",
-                    "status": status,
-                    "metrics": metrics,
-                    "timestamp": time.time()
-                })
-            
-            await asyncio.sleep(1)
+            await websocket.receive_text()
             
     except WebSocketDisconnect:
-        connected_clients.remove(websocket)
+        pass
     except Exception as e:
-        print(f"WebSocket error: {e}")
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WebSocket error: %s", e)
+    finally:
+        connected_clients.discard(websocket)
 
 # Health check
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "system_available": kaygee_system is not None
-    }
+    return Response(_HEALTH_BYTES[kaygee_system is not None], media_type="application/json")
 
 # Frontend compatibility endpoints (stubs)
 @app.get("/api/resonance/status")
@@ -437,80 +471,139 @@ async def post_resonance(signature: Dict[str, Any]):
     return {"status": "received", "received": signature, "timestamp": time.time()}
 
 
+@lru_cache(maxsize=1)
+def _get_pyplot():
+    """Import pyplot once on the non-interactive Agg backend (no display probe)"""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        # Emit text as <text> elements instead of tessellated glyph paths
+        plt.rcParams["svg.fonttype"] = "none"
+        return plt
+    except Exception:
+        return None
+
+
+def _close_figure(fig):
+    """Release a matplotlib figure if one was returned by the generator"""
+    plt = _get_pyplot()
+    if plt is not None:
+        try:
+            plt.close(fig)
+        except Exception:
+            pass
+
+
+def _stream_svg(parts, fig):
+    """Encode SVG fragments as they are produced, closing the figure once done"""
+    try:
+        for part in parts:
+            yield part.encode("utf-8")
+    finally:
+        _close_figure(fig)
+
+
+@lru_cache(maxsize=1)
+def _get_spacefield_gen():
+    """Load the workspace-root `spacefield_generator/main.py` once per process.
+
+    Returns `(generator, svg_fn)` or None when the module is missing or fails to
+    import, so the fallback stub is served without retrying the import. `svg_fn`
+    yields SVG fragments (`iter_svg`) when the generator supports it, otherwise it
+    returns the whole string (`get_svg_string`).
+    """
+    spacefield_path = Path(__file__).parent.parent.parent / "spacefield_generator" / "main.py"
+    if not spacefield_path.exists():
+        return None
+
+    # Select the Agg backend before the generator module pulls in matplotlib
+    _get_pyplot()
+
+    try:
+        spec = importlib.util.spec_from_file_location("spacefield_generator_main", spacefield_path)
+        sf_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sf_mod)
+    except Exception as e:
+        logger.warning("⚠️  Space field generator import failed: %s", e)
+        return None
+
+    # Prefer an existing generator instance, else instantiate the class
+    gen = None
+    if hasattr(sf_mod, 'generator') and getattr(sf_mod, 'generator'):
+        gen = getattr(sf_mod, 'generator')
+    elif hasattr(sf_mod, 'SpaceFieldGenerator'):
+        gen = sf_mod.SpaceFieldGenerator()
+
+    if not gen:
+        return None
+    return gen, getattr(gen, 'iter_svg', None) or getattr(gen, 'get_svg_string', None)
+
+
 @app.post("/visualization/space_field")
 async def generate_space_field(params: Dict[str, Any]):
     """Generate a space field visualization.
 
     Attempts to delegate generation to the top-level `spacefield_generator/main.py`
-    if present; otherwise falls back to a simple SVG stub.
+    if present; otherwise falls back to a simple SVG stub. The SVG is returned as
+    `image/svg+xml` with generator metrics in the `X-Metrics` header.
     """
     try:
-        # Try to import the external spacefield generator module from workspace root
-        import importlib.util
-        from pathlib import Path
-
-        spacefield_path = Path(__file__).parent.parent.parent / "spacefield_generator" / "main.py"
-        if spacefield_path.exists():
-            spec = importlib.util.spec_from_file_location("spacefield_generator_main", spacefield_path)
-            sf_mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(sf_mod)
-
-            # Prefer an existing generator instance, else instantiate the class
-            gen = None
-            if hasattr(sf_mod, 'generator') and getattr(sf_mod, 'generator'):
-                gen = getattr(sf_mod, 'generator')
-            elif hasattr(sf_mod, 'SpaceFieldGenerator'):
-                gen = sf_mod.SpaceFieldGenerator()
-
-            if gen:
-                # Map expected params and call generator
-                sides = int(params.get('sides', 4))
-                levels = int(params.get('levels', 3))
-                alpha = float(params.get('alpha', 0.444))
-                rotation_angle = float(params.get('rotation_angle', 0))
-                edges_only = bool(params.get('edges_only', True))
-                width = int(params.get('width', 400))
-                height = int(params.get('height', 200))
-                dpi = int(params.get('dpi', 100))
-
-                fig, metrics = gen.generate(
-                    sides=sides,
-                    levels=levels,
-                    alpha=alpha,
-                    rotation_angle=rotation_angle,
-                    edges_only=edges_only,
-                    width=width,
-                    height=height,
-                    dpi=dpi
-                )
-
-                # Prefer generator-provided SVG helper if available
-                if hasattr(gen, 'get_svg_string'):
-                    svg_content = gen.get_svg_string(fig)
-                else:
-                    # Basic fallback serialization
-                    svg_content = f"<svg width='{width}' height='{height}' xmlns='http://www.w3.org/2000/svg'><rect width='100%' height='100%' fill='#0b1226'/><text x='10' y='20' fill='#9bf'>Space Field Generated</text></svg>"
-
-                # Try to close matplotlib figure if one was returned
-                try:
-                    import matplotlib.pyplot as plt
-                    plt.close(fig)
-                except Exception:
-                    pass
-
-                return {"svg": svg_content, "metrics": metrics, "timestamp": time.time()}
+        gen, svg_fn = _get_spacefield_gen() or (None, None)
+
+        if gen:
+            # Map expected params and call generator
+            sides = int(params.get('sides', 4))
+            levels = int(params.get('levels', 3))
+            alpha = float(params.get('alpha', 0.444))
+            rotation_angle = float(params.get('rotation_angle', 0))
+            edges_only = bool(params.get('edges_only', True))
+            width = int(params.get('width', 400))
+            height = int(params.get('height', 200))
+            dpi = int(params.get('dpi', 100))
+
+            fig, metrics = gen.generate(
+                sides=sides,
+                levels=levels,
+                alpha=alpha,
+                rotation_angle=rotation_angle,
+                edges_only=edges_only,
+                width=width,
+                height=height,
+                dpi=dpi
+            )
+
+            # Prefer generator-provided SVG helper if available
+            if svg_fn:
+                svg_content = svg_fn(fig)
+            else:
+                # Basic fallback serialization
+                svg_content = f"<svg width='{width}' height='{height}' xmlns='http://www.w3.org/2000/svg'><rect width='100%' height='100%' fill='#0b1226'/><text x='10' y='20' fill='#9bf'>Space Field Generated</text></svg>"
+            if isinstance(svg_content, str):
+                svg_content = (svg_content,)
+
+            return StreamingResponse(
+                _stream_svg(svg_content, fig),
+                media_type="image/svg+xml",
+                headers={
+                    "X-Metrics": orjson.dumps(metrics).decode(),
+                    "X-Timestamp": repr(time.time())
+                }
+            )
 
     except Exception as e:
         # Log and fall back to template stub
-        print(f"⚠️  Space field generation via external module failed: {e}")
+        logger.warning("⚠️  Space field generation via external module failed: %s", e)
 
-    # Fallback stub (keeps same shape as earlier simple stub)
+    # Fallback stub
     svg = "<svg xmlns='http://www.w3.org/2000/svg' width='400' height='200'>" \
           "<rect width='100%' height='100%' fill='#0b1226'/>" \
           "<text x='50' y='100' fill='#9bf' font-size='18'>Space Field Visualization (stub)</text></svg>"
-    return {"svg": svg, "timestamp": time.time()}
+    return Response(svg, media_type="image/svg+xml", headers={"X-Timestamp": repr(time.time())})
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    logging.basicConfig(level=logging.INFO)
+    # uvloop/httptools ship with uvicorn[standard]; keep uvicorn's own logs to warnings
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools", log_level="warning")
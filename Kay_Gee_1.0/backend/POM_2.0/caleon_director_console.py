@@ -4,9 +4,154 @@ Caleon Director Console - Manual control interface for Caleon's voice evolution
 """
 
 import argparse
-import json
 import os
-from POM.caleon_instance import CaleonPOMInstance
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+# Learned scores can be numpy scalars; keep the indented on-disk layout
+_DNA_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+
+@lru_cache(maxsize=4)
+def _load_caleon(instance_id: str):
+    """Import and build a Caleon instance on first use, at most once per ID"""
+    # Deferred so --help and argument errors don't pay for the POM import chain
+    from POM.caleon_instance import CaleonPOMInstance
+    return CaleonPOMInstance(instance_id)
+
+
+def _cmd_setup(args, load_caleon):
+    print(f"🏗️  Setting up Caleon instance: {args.instance_id}")
+    load_caleon(args.instance_id)
+    print("✅ Setup complete")
+
+
+def _cmd_evolve(args, load_caleon):
+    if not args.samples:
+        print("❌ No sample content provided. Use --samples to specify content files")
+        return
+
+    # Load content from files, reading the existing ones concurrently
+    found = []
+    for sample_file in args.samples:
+        if os.path.exists(sample_file):
+            found.append(Path(sample_file))
+        else:
+            print(f"⚠️  Sample file not found: {sample_file}")
+
+    content_samples = []
+    if found:
+        with ThreadPoolExecutor(max_workers=min(8, len(found))) as executor:
+            content_samples = list(executor.map(Path.read_text, found))
+
+    if content_samples:
+        load_caleon(args.instance_id).evolve_voice(content_samples, args.target_performance)
+    else:
+        print("❌ No valid sample content found")
+
+
+def _cmd_export_dna(args, load_caleon):
+    caleon = load_caleon(args.instance_id)
+    dna = caleon.export_voice_dna()
+
+    output_file = args.output or f"caleon_dna_{args.instance_id}_{time.time_ns() // 1_000_000_000}.json"
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(dna, option=_DNA_DUMP_OPTIONS))
+
+    print(f"💾 Caleon's DNA exported to: {output_file}")
+
+
+def _cmd_restore(args, load_caleon):
+    if not os.path.exists(args.restore):
+        print(f"❌ DNA file not found: {args.restore}")
+        return
+
+    with open(args.restore, 'rb') as f:
+        dna = orjson.loads(f.read())
+
+    print(f"🔄 Restoring Caleon from: {args.restore}")
+
+    # Create instance and restore state
+    caleon = load_caleon(dna["instance_id"])
+
+    # Restore voice registry
+    from POM.caleon_voice_oracle import restore_voice_signatures
+    caleon.oracle.voice_registry = restore_voice_signatures(dna["voice_registry"])
+
+    # Restore learning params
+    learning_params = dna["learning_params"]
+    caleon.oracle.learning_rate = learning_params["learning_rate"]
+    caleon.oracle.exploration_rate = learning_params["exploration_rate"]
+
+    # Save restored state
+    caleon.oracle._save_voice_registry()
+
+    print("✅ Caleon restored successfully")
+
+
+def _cmd_adjust(args, load_caleon):
+    if not args.voice_id or not args.param or args.value is None:
+        print("❌ Must specify --voice-id, --param, and --value")
+        return
+
+    caleon = load_caleon(args.instance_id)
+
+    # Find the voice
+    voice = next((v for v in caleon.oracle.voice_registry if v.signature_id == args.voice_id), None)
+    if not voice:
+        print(f"❌ Voice not found: {args.voice_id}")
+        return
+
+    # Adjust parameter
+    if hasattr(voice, args.param):
+        old_value = getattr(voice, args.param)
+        setattr(voice, args.param, args.value)
+        print(f"🔧 Adjusted {args.voice_id}.{args.param}: {old_value} → {args.value}")
+
+        # Save changes
+        caleon.oracle._save_voice_registry()
+    else:
+        print(f"❌ Parameter not found: {args.param}")
+
+
+def _cmd_inspect(args, load_caleon):
+    caleon = load_caleon(args.instance_id)
+
+    print(f"🔍 Inspecting Caleon Instance: {args.instance_id}")
+    print(f"   Voices: {len(caleon.oracle.voice_registry)}")
+    print(f"   Evolution events: {len(caleon.evolution_log)}")
+    print(f"   Performance logs: {len(caleon.oracle.performance_log)}")
+
+    if args.show_voices:
+        print("\n🎭 Voice Registry:")
+        for voice in caleon.oracle.voice_registry:
+            print(f"   • {voice.signature_id}: score={voice.success_score:.3f}, uses={voice.usage_count}")
+
+    if args.show_performance:
+        print("\n📊 Recent Performance:")
+        for log in caleon.oracle.performance_log[-5:]:  # Last 5
+            print(f"   • {log['voice_id']}: reward={log['reward']:.3f}")
+
+
+# Commands in precedence order (first flag set wins)
+_COMMANDS = {
+    "setup": _cmd_setup,
+    "evolve": _cmd_evolve,
+    "export_dna": _cmd_export_dna,
+    "restore": _cmd_restore,
+    "adjust": _cmd_adjust,
+    "inspect": _cmd_inspect,
+}
+
+
+def _pick(args):
+    """Name of the requested command, or None if no command flag was given"""
+    return next((name for name in _COMMANDS if getattr(args, name)), None)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Caleon Director Console")
@@ -25,117 +170,15 @@ def main():
     parser.add_argument("--inspect", action="store_true", help="Inspect Caleon's current state")
     parser.add_argument("--show-voices", action="store_true", help="Show voice registry")
     parser.add_argument("--show-performance", action="store_true", help="Show performance log")
-    
+
     args = parser.parse_args()
-    
-    if args.setup:
-        print(f"🏗️  Setting up Caleon instance: {args.instance_id}")
-        caleon = CaleonPOMInstance(args.instance_id)
-        print("✅ Setup complete")
-    
-    elif args.evolve:
-        caleon = CaleonPOMInstance(args.instance_id)
-        
-        if args.samples:
-            # Load content from files
-            content_samples = []
-            for sample_file in args.samples:
-                if os.path.exists(sample_file):
-                    with open(sample_file, 'r') as f:
-                        content_samples.append(f.read())
-                else:
-                    print(f"⚠️  Sample file not found: {sample_file}")
-            
-            if content_samples:
-                caleon.evolve_voice(content_samples, args.target_performance)
-            else:
-                print("❌ No valid sample content found")
-        else:
-            print("❌ No sample content provided. Use --samples to specify content files")
-    
-    elif args.export_dna:
-        caleon = CaleonPOMInstance(args.instance_id)
-        dna = caleon.export_voice_dna()
-        
-        output_file = args.output or f"caleon_dna_{args.instance_id}_{int(__import__('time').time())}.json"
-        with open(output_file, 'w') as f:
-            json.dump(dna, f, indent=2)
-        
-        print(f"💾 Caleon's DNA exported to: {output_file}")
-    
-    elif args.restore:
-        if not os.path.exists(args.restore):
-            print(f"❌ DNA file not found: {args.restore}")
-            return
-        
-        with open(args.restore, 'r') as f:
-            dna = json.load(f)
-        
-        print(f"🔄 Restoring Caleon from: {args.restore}")
-        
-        # Create instance and restore state
-        caleon = CaleonPOMInstance(dna["instance_id"])
-        
-        # Restore voice registry
-        from POM.caleon_voice_oracle import VoiceSignature
-        caleon.oracle.voice_registry = [
-            VoiceSignature(**voice_data) for voice_data in dna["voice_registry"]
-        ]
-        
-        # Restore learning params
-        learning_params = dna["learning_params"]
-        caleon.oracle.learning_rate = learning_params["learning_rate"]
-        caleon.oracle.exploration_rate = learning_params["exploration_rate"]
-        
-        # Save restored state
-        caleon.oracle._save_voice_registry()
-        
-        print("✅ Caleon restored successfully")
-    
-    elif args.adjust:
-        if not args.voice_id or not args.param or args.value is None:
-            print("❌ Must specify --voice-id, --param, and --value")
-            return
-        
-        caleon = CaleonPOMInstance(args.instance_id)
-        
-        # Find the voice
-        voice = next((v for v in caleon.oracle.voice_registry if v.signature_id == args.voice_id), None)
-        if not voice:
-            print(f"❌ Voice not found: {args.voice_id}")
-            return
-        
-        # Adjust parameter
-        if hasattr(voice, args.param):
-            old_value = getattr(voice, args.param)
-            setattr(voice, args.param, args.value)
-            print(f"🔧 Adjusted {args.voice_id}.{args.param}: {old_value} → {args.value}")
-            
-            # Save changes
-            caleon.oracle._save_voice_registry()
-        else:
-            print(f"❌ Parameter not found: {args.param}")
-    
-    elif args.inspect:
-        caleon = CaleonPOMInstance(args.instance_id)
-        
-        print(f"🔍 Inspecting Caleon Instance: {args.instance_id}")
-        print(f"   Voices: {len(caleon.oracle.voice_registry)}")
-        print(f"   Evolution events: {len(caleon.evolution_log)}")
-        print(f"   Performance logs: {len(caleon.oracle.performance_log)}")
-        
-        if args.show_voices:
-            print("\n🎭 Voice Registry:")
-            for voice in caleon.oracle.voice_registry:
-                print(f"   • {voice.signature_id}: score={voice.success_score:.3f}, uses={voice.usage_count}")
-        
-        if args.show_performance:
-            print("\n📊 Recent Performance:")
-            for log in caleon.oracle.performance_log[-5:]:  # Last 5
-                print(f"   • {log['voice_id']}: reward={log['reward']:.3f}")
-    
-    else:
+
+    command = _pick(args)
+    if command is None:
         parser.print_help()
+        return
+
+    _COMMANDS[command](args, _load_caleon)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
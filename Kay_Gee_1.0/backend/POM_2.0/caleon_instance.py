@@ -110,17 +110,14 @@ class CaleonPOMInstance:
         print(f"   → Content: '{content[:60]}...'")
         
         # 1. Her oracle chooses voice
-        chosen_voice = self.oracle.choose_voice(content, context)
+        chosen_voice, content_vector = self.oracle.choose_voice_with_vector(content, context)
         
         # 2. Log her choice
         self.evolution_log.append({
             "timestamp": time.time(),
             "voice_id": chosen_voice.signature_id,
             "content_id": content_id,
-            "fitness": chosen_voice.calculate_fitness(
-                self.oracle._content_to_vector(content),
-                context
-            ),
+            "fitness": chosen_voice.calculate_fitness(content_vector, context),
             "context": context
         })
         
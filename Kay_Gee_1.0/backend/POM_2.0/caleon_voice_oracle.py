@@ -4,7 +4,7 @@ import time
 import random
 import hashlib
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 @dataclass
 class VoiceSignature:
@@ -81,6 +81,27 @@ class VoiceSignature:
         
         return score
 
+_VOICE_FIELDS = frozenset(f.name for f in fields(VoiceSignature))
+
+def restore_voice_signatures(records: List[Dict]) -> List[VoiceSignature]:
+    """Rebuild voices from exported DNA records (``vars(voice)`` dicts)
+    
+    Complete records come from our own export and skip ``__init__``; partial
+    ones go through the regular constructor so field defaults still apply.
+    """
+    new_voice = object.__new__
+    voices = []
+    for data in records:
+        if data.keys() == _VOICE_FIELDS:
+            voice = new_voice(VoiceSignature)
+            voice.__dict__.update(data)
+            if voice.semantic_tags is None:
+                voice.semantic_tags = []
+        else:
+            voice = VoiceSignature(**data)
+        voices.append(voice)
+    return voices
+
 class CaleonVoiceOracle:
     """Caleon's decision-making system for voice selection"""
     
@@ -131,6 +152,13 @@ class CaleonVoiceOracle:
         """
         Caleon selects her best voice for this content
         """
+        return self.choose_voice_with_vector(content, context)[0]
+    
+    def choose_voice_with_vector(self, content: str, context: Dict) -> Tuple[VoiceSignature, np.ndarray]:
+        """
+        Like `choose_voice`, also returning the content vector used for matching
+        so callers can score the chosen voice without re-vectorizing
+        """
         print(f"🎭 Caleon Oracle: Choosing voice for '{content[:50]}...'")
         
         # 1. Vectorize content for semantic matching
@@ -164,7 +192,7 @@ class CaleonVoiceOracle:
         # 5. Save updated registry
         self._save_voice_registry()
         
-        return chosen_voice
+        return chosen_voice, content_vector
     
     def _content_to_vector(self, text: str) -> np.ndarray:
         """Convert text to semantic vector"""
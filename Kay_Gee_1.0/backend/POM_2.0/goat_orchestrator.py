@@ -2,9 +2,10 @@
 import json
 import time
 import os
+import orjson
+from functools import partial
 from typing import Dict
 from POM.caleon_instance import CaleonPOMInstance
-from POM.skg_ucm_bridge import SKGUCMBridge
 
 class GOATOrchestrator:
     def __init__(self):
@@ -14,7 +15,7 @@ class GOATOrchestrator:
         # Initialize Caleon's personal instance
         self.caleon = CaleonPOMInstance(instance_id="caleon_primary")
         
-        # UCM Bridge (if UCM exists)
+        # UCM Bridge (if UCM exists); import POM.skg_ucm_bridge only when wiring it up
         self.ucm_bridge = None  # SKGUCMBridge(self.skg, self.ucm_instance) if hasattr(self, 'ucm_instance') else None
         
         # Directors (placeholders)
@@ -40,15 +41,19 @@ class GOATOrchestrator:
             # Register for analytics when they arrive
             self.ucm_bridge.ucm.subscribe(
                 f"analytics_{content_id}",
-                lambda data: self.caleon.oracle.receive_feedback(
-                    voice_id=self.caleon.oracle.voice_registry[-1].signature_id,
-                    content_hash=content_id,
-                    performance_score=data.get("engagement_score", 0.5)
-                )
+                partial(self._receive_analytics, content_id)
             )
         
         return output
     
+    def _receive_analytics(self, content_id: str, data: Dict):
+        """UCM analytics callback: feed engagement back to Caleon's current voice"""
+        self.caleon.oracle.receive_feedback(
+            voice_id=self.caleon.oracle.voice_registry[-1].signature_id,
+            content_hash=content_id,
+            performance_score=data.get("engagement_score", 0.5)
+        )
+    
     def caleon_voice_surgery(self, sample_content: list):
         """
         Manually trigger Caleon's evolution
@@ -66,8 +71,9 @@ class GOATOrchestrator:
         # Save her evolved state
         dna = self.caleon.export_voice_dna()
         os.makedirs("backups", exist_ok=True)
-        with open(f"backups/caleon_dna_backup_{int(time.time())}.json", 'w') as f:
-            json.dump(dna, f, indent=2)
+        ts = time.time_ns() // 1_000_000_000
+        with open(f"backups/caleon_dna_backup_{ts}.json", 'wb') as f:
+            f.write(orjson.dumps(dna, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
         print("✅ Caleon evolution complete. Backup saved.")
 
@@ -87,7 +93,7 @@ if __name__ == "__main__":
         orchestrator = GOATOrchestrator()
         
         context = json.loads(args.context) if args.context else {}
-        content_id = args.content_id or f"cli_{int(time.time())}"
+        content_id = args.content_id or f"cli_{time.time_ns() // 1_000_000_000}"
         
         output_path = orchestrator.generate_with_caleon(
             content=args.content,
@@ -4,9 +4,11 @@
 import matplotlib
 matplotlib.use('Agg')
 
+import io
 import logging
 import json
 import time
+import numpy as np
 from TTS.api import TTS
 from pydub import AudioSegment
 from larynx_sim import LarynxSimulator
@@ -76,14 +78,11 @@ class PhonatoryOutputModule:
             RuntimeError: If synthesis or audio processing fails.
         """
         # Input validation
-        if not isinstance(text, str) or not text.strip():
-            raise ValueError("Text must be a non-empty string")
+        self._validate_phonation(text, pitch_factor)
         if out_path is None:
             out_path = f"output_voice_{int(time.time())}.wav"
         if not out_path.endswith(".wav"):
             raise ValueError("Output path must be a .wav file")
-        if not isinstance(pitch_factor, (int, float)) or pitch_factor <= 0:
-            raise ValueError("Pitch factor must be a positive number")
 
         try:
             # Synthesize base audio
@@ -91,18 +90,7 @@ class PhonatoryOutputModule:
             self.logger.info(f"Base audio synthesized to {out_path}")
             # Load and process audio
             audio_data = AudioSegment.from_wav(out_path)
-            # Advanced processing (if implemented)
-            if hasattr(self.larynx, 'modulate_pitch'):
-                audio_data = self.larynx.modulate_pitch(audio_data, pitch_factor)
-            if formant_target and hasattr(self.formant, 'shape_vowel'):
-                audio_data = self.formant.shape_vowel(audio_data, formant_target)
-            if articulation:
-                if hasattr(self.tongue, 'apply_articulation_effects'):
-                    audio_data = self.tongue.apply_articulation_effects(audio_data, articulation)
-                if hasattr(self.lip, 'apply_lip_effects'):
-                    audio_data = self.lip.apply_lip_effects(audio_data, articulation)
-            if nasalization and hasattr(self.uvula, 'apply_nasalization_effects'):
-                audio_data = self.uvula.apply_nasalization_effects(audio_data, nasalization)
+            audio_data = self._apply_phonatory_effects(audio_data, pitch_factor, formant_target, articulation, nasalization)
             audio_data.export(out_path, format="wav")
             self.logger.info(f"Voice emitted to {out_path}")
             return out_path
@@ -110,6 +98,68 @@ class PhonatoryOutputModule:
             self.logger.error(f"Phonation failed: {str(e)}")
             raise RuntimeError(f"Phonation failed: {str(e)}")
 
+    def phonate_stream(self, text: str, chunk_cb, pitch_factor=1.0, formant_target=None, articulation=None, nasalization=None, chunk_size=4096):
+        """
+        Generate voice output in memory and hand it to `chunk_cb` as WAV byte chunks.
+
+        Same processing as `phonate`, without writing or re-reading a file.
+
+        Args:
+            text (str): Input text to synthesize.
+            chunk_cb (callable): Called with each `bytes` chunk of the WAV stream, in order.
+            chunk_size (int): Maximum chunk size in bytes (default: 4096).
+            Remaining arguments as for `phonate`.
+
+        Raises:
+            ValueError: If input text or parameters are invalid.
+            RuntimeError: If synthesis or audio processing fails.
+        """
+        self._validate_phonation(text, pitch_factor)
+
+        try:
+            # Synthesize base audio straight to 16-bit PCM, peak-normalised the same
+            # way the TTS file writer behind `phonate` does, so loudness matches
+            samples = np.asarray(self.tts.tts(text=text), dtype=np.float32)
+            pcm = (samples * (32767 / max(0.01, float(np.max(np.abs(samples)))))).astype(np.int16)
+            audio_data = AudioSegment(
+                data=pcm.tobytes(),
+                sample_width=2,
+                frame_rate=self.tts.synthesizer.output_sample_rate,
+                channels=1,
+            )
+            audio_data = self._apply_phonatory_effects(audio_data, pitch_factor, formant_target, articulation, nasalization)
+            buffer = io.BytesIO()
+            audio_data.export(buffer, format="wav")
+        except Exception as e:
+            self.logger.error(f"Phonation failed: {str(e)}")
+            raise RuntimeError(f"Phonation failed: {str(e)}")
+
+        view = buffer.getbuffer()
+        for start in range(0, len(view), chunk_size):
+            chunk_cb(bytes(view[start:start + chunk_size]))
+        self.logger.info(f"Voice streamed ({len(view)} bytes)")
+
+    def _validate_phonation(self, text, pitch_factor):
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("Text must be a non-empty string")
+        if not isinstance(pitch_factor, (int, float)) or pitch_factor <= 0:
+            raise ValueError("Pitch factor must be a positive number")
+
+    def _apply_phonatory_effects(self, audio_data, pitch_factor, formant_target, articulation, nasalization):
+        """Advanced processing (if implemented)"""
+        if hasattr(self.larynx, 'modulate_pitch'):
+            audio_data = self.larynx.modulate_pitch(audio_data, pitch_factor)
+        if formant_target and hasattr(self.formant, 'shape_vowel'):
+            audio_data = self.formant.shape_vowel(audio_data, formant_target)
+        if articulation:
+            if hasattr(self.tongue, 'apply_articulation_effects'):
+                audio_data = self.tongue.apply_articulation_effects(audio_data, articulation)
+            if hasattr(self.lip, 'apply_lip_effects'):
+                audio_data = self.lip.apply_lip_effects(audio_data, articulation)
+        if nasalization and hasattr(self.uvula, 'apply_nasalization_effects'):
+            audio_data = self.uvula.apply_nasalization_effects(audio_data, nasalization)
+        return audio_data
+
     def diagnostics(self):
         import TTS
         self.logger.info(f"TTS package version: {getattr(TTS, '__version__', 'unknown')}")
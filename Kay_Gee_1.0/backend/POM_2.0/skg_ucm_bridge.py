@@ -1,8 +1,171 @@
-from typing import Dict, Any
-import threading
+from dataclasses import dataclass
+from functools import cached_property, partial
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Sequence, Tuple
+import asyncio
+import re
 import time
 import numpy as np
 
+# Resolved once at import; the oracle itself is only built on first use
+try:
+    from POM.caleon_voice_oracle import CaleonVoiceOracle
+except ImportError:
+    CaleonVoiceOracle = None
+
+# Keyword buckets for content vectorization, matched in a single regex pass
+_TECHNICAL_WORDS = ("quantum", "algorithm", "neural", "machine", "learning", "data")
+_EMOTIONAL_WORDS = ("amazing", "wonderful", "terrible", "sad", "exciting")
+_KEYWORD_BUCKET = {
+    **{word: "tech" for word in _TECHNICAL_WORDS},
+    **{word: "emotion" for word in _EMOTIONAL_WORDS},
+}
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_BUCKET)))
+
+# Semantic tag keywords; the lookahead reports overlapping hits like separate substring checks would
+_SEMANTIC_KEYWORDS = {
+    "technical": "technical", "quantum": "technical",
+    "emotional": "emotional", "personal": "emotional",
+    "tutorial": "educational", "guide": "educational",
+}
+_SEMANTIC_TAG_ORDER = ("technical", "emotional", "educational")
+_SEMANTIC_RE = re.compile("(?=(" + "|".join(map(re.escape, _SEMANTIC_KEYWORDS)) + "))")
+
+def _lowered_text(metadata: Dict) -> str:
+    """Lowercased "title description" text, computed once per ingest"""
+    return f"{metadata.get('title', '')} {metadata.get('description', '')}".lower()
+
+def _description_start(metadata: Dict) -> int:
+    """Offset of the description within `_lowered_text(metadata)`"""
+    return len(f"{metadata.get('title', '')}".lower()) + 1
+
+def _keyword_counts(lowered_text: str, pos: int = 0) -> Tuple[int, int]:
+    """Distinct (technical, emotional) keywords in already-lowercased text, from `pos` on"""
+    tech = emotion = 0
+    for word in set(_KEYWORD_RE.findall(lowered_text, pos)):
+        if _KEYWORD_BUCKET[word] == "tech":
+            tech += 1
+        else:
+            emotion += 1
+    return tech, emotion
+
+@dataclass
+class ContentVectorEntry:
+    """One SKG content vector with its ingest metadata"""
+    __slots__ = ("vector", "tags", "timestamp", "source")
+    
+    vector: np.ndarray
+    tags: List[str]
+    timestamp: float
+    source: str
+
+class ContentVectorStore:
+    """
+    Structure-of-arrays storage for SKG content vectors
+    
+    Row i of `content_matrix` / `timestamps` belongs to `content_ids[i]`, so
+    similarity search over all content is a single matrix-vector product.
+    """
+    
+    def __init__(self, dim: int = 10, capacity: int = 64):
+        self.dim = dim
+        self.content_matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.content_ids: List[str] = []
+        self.tags: List[List[str]] = []
+        self.sources: List[str] = []
+        self._rows: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.content_ids)
+    
+    def __contains__(self, content_id: str) -> bool:
+        return content_id in self._rows
+    
+    def _reserve(self, size: int):
+        """Grow the backing arrays (doubling) to hold at least `size` rows"""
+        capacity = len(self.timestamps)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[:len(self)] = self.content_matrix[:len(self)]
+        timestamps = np.zeros(capacity, dtype=np.float64)
+        timestamps[:len(self)] = self.timestamps[:len(self)]
+        self.content_matrix, self.timestamps = matrix, timestamps
+    
+    def append(self, content_id: str, vector: np.ndarray, tags: List[str], timestamp: float, source: str = "unknown"):
+        """Store one content vector; re-ingesting an id overwrites its row"""
+        row = self._rows.get(content_id)
+        if row is None:
+            row = len(self)
+            self._reserve(row + 1)
+            self._rows[content_id] = row
+            self.content_ids.append(content_id)
+            self.tags.append(tags)
+            self.sources.append(source)
+        else:
+            self.tags[row] = tags
+            self.sources[row] = source
+        self.content_matrix[row] = vector
+        self.timestamps[row] = timestamp
+    
+    def extend(self, content_ids: Sequence[str], vectors: np.ndarray, tags: Sequence[List[str]], timestamp: float, sources: Sequence[str]):
+        """Store a batch of new content vectors with one block copy"""
+        if len(set(content_ids)) != len(content_ids) or any(cid in self._rows for cid in content_ids):
+            # Overwrites need per-row placement
+            for i, content_id in enumerate(content_ids):
+                self.append(content_id, vectors[i], tags[i], timestamp, sources[i])
+            return
+        start = len(self)
+        end = start + len(content_ids)
+        self._reserve(end)
+        self.content_matrix[start:end] = vectors
+        self.timestamps[start:end] = timestamp
+        self._rows.update(zip(content_ids, range(start, end)))
+        self.content_ids.extend(content_ids)
+        self.tags.extend(tags)
+        self.sources.extend(sources)
+    
+    def get(self, content_id: str) -> Optional[ContentVectorEntry]:
+        """Entry for one content id (its vector is a view into the store)"""
+        row = self._rows.get(content_id)
+        if row is None:
+            return None
+        return ContentVectorEntry(
+            self.content_matrix[row],
+            self.tags[row],
+            float(self.timestamps[row]),
+            self.sources[row]
+        )
+    
+    def search(self, query_vec: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        """Top-k content ids by cosine similarity to `query_vec`, best first"""
+        n = len(self)
+        if n == 0 or k <= 0:
+            return []
+        matrix = self.content_matrix[:n]
+        query = np.asarray(query_vec, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        scores = (matrix @ query) / np.where(norms == 0, 1.0, norms)
+        k = min(k, n)
+        top = np.argpartition(scores, n - k)[n - k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self.content_ids[i], float(scores[i])) for i in top]
+
+# Strong references to handler tasks scheduled from synchronous publishers
+_pending_tasks = set()
+
+def _dispatch(coro: Awaitable[None]):
+    """Run a handler coroutine from a synchronous publisher"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coro)
+    else:
+        task = loop.create_task(coro)
+        _pending_tasks.add(task)
+        task.add_done_callback(_pending_tasks.discard)
+
 class SKGUCMBridge:
     """
     Bidirectional sync between Unified Content Manager and Speaker Knowledge Graph
@@ -11,39 +174,89 @@ class SKGUCMBridge:
     def __init__(self, skg_manager, ucm_instance):
         self.skg = skg_manager
         self.ucm = ucm_instance
-        self.sync_lock = threading.Lock()
+        
+        # Allocate SKG-side stores once instead of checking on every event
+        if not hasattr(self.skg, 'content_store'):
+            self.skg.content_store = ContentVectorStore()
+        if not hasattr(self.skg, 'performance_queue'):
+            self.skg.performance_queue = {}
+        self._content_store = self.skg.content_store
+        self._performance_queue = self.skg.performance_queue
         
         # Subscribe to UCM content events
-        if hasattr(self.ucm, 'subscribe'):
-            self.ucm.subscribe("content_ingested", self._on_content_ingested)
-            self.ucm.subscribe("content_published", self._on_content_published)
-            self.ucm.subscribe("listener_analytics", self._on_analytics_received)
+        self._subscribe("content_ingested", self._on_content_ingested)
+        self._subscribe("content_ingested_batch", self._on_content_ingested_batch)
+        self._subscribe("content_published", self._on_content_published)
+        self._subscribe("listener_analytics", self._on_analytics_received)
+    
+    def _subscribe(self, event: str, handler: Callable[..., Awaitable[None]]):
+        """Register an async handler, adapting it for UCMs that only dispatch synchronously
+        
+        Handlers run on the event loop and only yield while the oracle works in a
+        thread, so SKG updates between awaits need no lock.
+        """
+        if hasattr(self.ucm, 'subscribe_async'):
+            self.ucm.subscribe_async(event, handler)
+        elif hasattr(self.ucm, 'subscribe'):
+            self.ucm.subscribe(event, lambda *args, **kwargs: _dispatch(handler(*args, **kwargs)))
     
-    def _on_content_ingested(self, content_id: str, metadata: Dict):
+    @cached_property
+    def oracle(self):
+        """Shared Caleon voice oracle, constructed on first use"""
+        if CaleonVoiceOracle is None:
+            raise ImportError("POM.caleon_voice_oracle is not available")
+        return CaleonVoiceOracle()
+    
+    async def _on_content_ingested(self, content_id: str, metadata: Dict):
         """Auto-enrich SKG when UCM receives new content"""
         
         print(f"🌉 UCM→SKG: New content '{content_id}' ingested")
         
-        with self.sync_lock:
-            # Extract semantic features
-            semantic_tags = self._extract_semantic_tags(metadata)
-            
-            # Create content vector in SKG
-            if not hasattr(self.skg, 'content_vectors'):
-                self.skg.content_vectors = {}
-            
-            self.skg.content_vectors[content_id] = {
-                "vector": self._vectorize_content(metadata),
-                "tags": semantic_tags,
-                "timestamp": time.time(),
-                "source": metadata.get("source", "unknown")
-            }
-            
-            # If content is tagged for Caleon, notify Oracle
+        # Extract semantic features (lowercasing the text once for all of them)
+        lowered_text = _lowered_text(metadata)
+        semantic_tags = self._extract_semantic_tags(metadata, lowered_text=lowered_text)
+        
+        # Create content vector in SKG
+        self._content_store.append(
+            content_id,
+            self._vectorize_content(metadata, lowered_text=lowered_text),
+            semantic_tags,
+            time.time(),
+            metadata.get("source", "unknown")
+        )
+        
+        # If content is tagged for Caleon, notify Oracle
+        if "caleon_narration" in metadata.get("tags", []):
+            await self._prepare_caleon_voice(content_id, metadata)
+    
+    async def _on_content_ingested_batch(self, items: List[Tuple[str, Dict]]):
+        """Auto-enrich SKG for a burst of (content_id, metadata) ingests in one pass
+        
+        Publishers without batch support keep using `content_ingested`.
+        """
+        
+        if not items:
+            return
+        
+        print(f"🌉 UCM→SKG: {len(items)} content items ingested")
+        
+        content_ids = [content_id for content_id, _ in items]
+        lowered_texts = [_lowered_text(metadata) for _, metadata in items]
+        vectors = self._vectorize_contents([metadata for _, metadata in items], lowered_texts=lowered_texts)
+        tags = [
+            self._extract_semantic_tags(metadata, lowered_text=lowered_text)
+            for (_, metadata), lowered_text in zip(items, lowered_texts)
+        ]
+        sources = [metadata.get("source", "unknown") for _, metadata in items]
+        timestamp = time.time()
+        
+        self._content_store.extend(content_ids, vectors, tags, timestamp, sources)
+        
+        for content_id, metadata in items:
             if "caleon_narration" in metadata.get("tags", []):
-                self._prepare_caleon_voice(content_id, metadata)
+                await self._prepare_caleon_voice(content_id, metadata)
     
-    def _on_content_published(self, content_id: str, publication_data: Dict):
+    async def _on_content_published(self, content_id: str, publication_data: Dict):
         """Track voice usage when content goes live"""
         
         voice_used = publication_data.get("voice_signature_id")
@@ -51,19 +264,17 @@ class SKGUCMBridge:
             print(f"🌉 Tracking: Caleon used {voice_used} for {content_id}")
             
             # Log in performance queue for later feedback
-            if not hasattr(self.skg, 'performance_queue'):
-                self.skg.performance_queue = {}
-            
-            self.skg.performance_queue[content_id] = {
+            self._performance_queue[content_id] = {
                 "voice_id": voice_used,
                 "timestamp": time.time(),
                 "status": "pending_feedback"
             }
     
-    def _on_analytics_received(self, content_id: str, analytics: Dict):
+    async def _on_analytics_received(self, content_id: str, analytics: Dict):
         """Feed listener analytics back to Caleon's Oracle"""
         
-        if not hasattr(self.skg, 'performance_queue') or content_id not in self.skg.performance_queue:
+        pending = self._performance_queue.get(content_id)
+        if pending is None:
             return
         
         print(f"🌉 UCM→SKG: Analytics received for {content_id}")
@@ -84,26 +295,24 @@ class SKGUCMBridge:
         )
         
         # Send to Oracle for learning
-        voice_id = self.skg.performance_queue[content_id]["voice_id"]
+        voice_id = pending["voice_id"]
         
-        # Import here to avoid circular imports
-        from POM.caleon_voice_oracle import CaleonVoiceOracle
-        oracle = CaleonVoiceOracle()
-        oracle.receive_feedback(
+        oracle = self.oracle
+        await asyncio.get_running_loop().run_in_executor(None, partial(
+            oracle.receive_feedback,
             voice_id=voice_id,
             content_hash=content_id,
             performance_score=performance_score,
             listener_feedback=listener_feedback
-        )
+        ))
         
         # Mark as processed
-        self.skg.performance_queue[content_id]["status"] = "processed"
+        pending["status"] = "processed"
     
-    def _prepare_caleon_voice(self, content_id: str, metadata: Dict):
+    async def _prepare_caleon_voice(self, content_id: str, metadata: Dict):
         """Pre-select voice signature for upcoming narration"""
         
-        from POM.caleon_voice_oracle import CaleonVoiceOracle
-        oracle = CaleonVoiceOracle()
+        oracle = self.oracle
         
         # Extract content snippets
         content_preview = metadata.get("preview_text", "")
@@ -116,54 +325,73 @@ class SKGUCMBridge:
         }
         
         # This will pre-load her choice into the registry
-        chosen_voice = oracle.choose_voice(content_preview, context)
+        chosen_voice, content_vector = await asyncio.get_running_loop().run_in_executor(
+            None, oracle.choose_voice_with_vector, content_preview, context
+        )
         
         # Store choice in UCM for reference
         if hasattr(self.ucm, 'set_content_metadata'):
             self.ucm.set_content_metadata(content_id, {
                 "preselected_voice_id": chosen_voice.signature_id,
-                "voice_fitness": chosen_voice.calculate_fitness(
-                    oracle._content_to_vector(content_preview),
-                    context
-                )
+                "voice_fitness": chosen_voice.calculate_fitness(content_vector, context)
             })
     
-    def _extract_semantic_tags(self, metadata: Dict) -> list:
-        """Extract semantic tags from content metadata"""
+    def _extract_semantic_tags(self, metadata: Dict, *, lowered_text: Optional[str] = None) -> list:
+        """Extract semantic tags from content metadata
         
-        tags = []
+        `lowered_text` is `_lowered_text(metadata)` when the caller already has it.
+        """
         
         # Extract from title and description
-        text = f"{metadata.get('title', '')} {metadata.get('description', '')}"
-        
-        # Simple tag extraction
-        if "technical" in text.lower() or "quantum" in text.lower():
-            tags.append("technical")
-        if "emotional" in text.lower() or "personal" in text.lower():
-            tags.append("emotional")
-        if "tutorial" in text.lower() or "guide" in text.lower():
-            tags.append("educational")
+        if lowered_text is None:
+            lowered_text = _lowered_text(metadata)
         
-        return tags
+        # Simple tag extraction: one scan for all keywords
+        found = {_SEMANTIC_KEYWORDS[word] for word in _SEMANTIC_RE.findall(lowered_text)}
+        return [tag for tag in _SEMANTIC_TAG_ORDER if tag in found]
     
-    def _vectorize_content(self, metadata: Dict) -> np.ndarray:
-        """Create a simple vector representation of content"""
+    def _vectorize_content(self, metadata: Dict, *, lowered_text: Optional[str] = None) -> np.ndarray:
+        """Create a simple vector representation of content
+        
+        `lowered_text` is `_lowered_text(metadata)` when the caller already has it.
+        """
         
         # Simple vector based on metadata
         vector = np.zeros(10)
+        description = metadata.get('description', '')
         
         # Length-based features
-        text_length = len(metadata.get('description', ''))
-        vector[0] = min(text_length / 1000, 1.0)  # Normalized length
+        vector[0] = min(len(description) / 1000, 1.0)  # Normalized length
+        
+        # Distinct keywords present per bucket, scanning only the description part
+        if lowered_text is None:
+            lowered_text = _lowered_text(metadata)
+        tech_count, emotion_count = _keyword_counts(lowered_text, _description_start(metadata))
         
         # Technical density
-        technical_words = ["quantum", "algorithm", "neural", "machine", "learning", "data"]
-        tech_count = sum(1 for word in technical_words if word in metadata.get('description', '').lower())
         vector[1] = min(tech_count / 5, 1.0)
         
         # Emotional tone (simplified)
-        emotional_words = ["amazing", "wonderful", "terrible", "sad", "exciting"]
-        emotion_count = sum(1 for word in emotional_words if word in metadata.get('description', '').lower())
         vector[2] = min(emotion_count / 3, 1.0)
         
-        return vector
\ No newline at end of file
+        return vector
+    
+    def _vectorize_contents(self, metadatas: List[Dict], *, lowered_texts: Optional[List[str]] = None) -> np.ndarray:
+        """Vectorize many metadata records at once; row i matches `_vectorize_content(metadatas[i])`"""
+        
+        n = len(metadatas)
+        matrix = np.zeros((n, 10))
+        if lowered_texts is None:
+            lowered_texts = [_lowered_text(metadata) for metadata in metadatas]
+        
+        lengths = np.fromiter((len(metadata.get('description', '')) for metadata in metadatas), dtype=np.float64, count=n)
+        counts = np.array(
+            [_keyword_counts(text, _description_start(metadata)) for metadata, text in zip(metadatas, lowered_texts)],
+            dtype=np.float64
+        ).reshape(n, 2)
+        
+        matrix[:, 0] = np.minimum(lengths / 1000, 1.0)
+        matrix[:, 1] = np.minimum(counts[:, 0] / 5, 1.0)
+        matrix[:, 2] = np.minimum(counts[:, 1] / 3, 1.0)
+        
+        return matrix
\ No newline at end of file
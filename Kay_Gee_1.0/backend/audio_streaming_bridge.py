@@ -8,13 +8,23 @@ import json
 import numpy as np
 import os
 import sys
+import threading
+from contextlib import nullcontext
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import AsyncGenerator, Dict, Optional
 import logging
 
 # Force CPU-only
 os.environ['CUDA_VISIBLE_DEVICES'] = ''
-os.environ['OMP_NUM_THREADS'] = '4'
+
+# BLAS/OpenMP read OMP_NUM_THREADS when first loaded, so cap DSP threads per call instead
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+DSP_THREADS = 4
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,14 +34,22 @@ backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir / 'cochlear_processor_3.0'))
 sys.path.insert(0, str(backend_dir / 'POM_2.0'))
 
-# Try to import components (graceful degradation)
-try:
-    from cochlear_processor_v3 import CochlearProcessorV3
-    COCHLEAR_AVAILABLE = True
-    logger.info("✅ Cochlear Processor loaded")
-except Exception as e:
-    COCHLEAR_AVAILABLE = False
-    logger.warning(f"⚠️ Cochlear not available: {e}")
+# Lazy load Cochlear to keep librosa/whisper out of module import (graceful degradation)
+COCHLEAR_AVAILABLE = None
+CochlearProcessorV3 = None
+
+def _load_cochlear():
+    global COCHLEAR_AVAILABLE, CochlearProcessorV3
+    if COCHLEAR_AVAILABLE is None:
+        try:
+            from cochlear_processor_v3 import CochlearProcessorV3 as Cochlear
+            CochlearProcessorV3 = Cochlear
+            COCHLEAR_AVAILABLE = True
+            logger.info("✅ Cochlear Processor loaded (lazy)")
+        except Exception as e:
+            COCHLEAR_AVAILABLE = False
+            logger.warning(f"⚠️ Cochlear not available: {e}")
+    return COCHLEAR_AVAILABLE
 
 # Lazy load POM to avoid heavy TTS dependencies at startup
 POM_AVAILABLE = None
@@ -51,6 +69,13 @@ def _load_pom():
     return POM_AVAILABLE
 
 
+def _locked(lock: threading.Lock, fn, *args, **kwargs):
+    """Call `fn` while holding `lock`, with native thread pools capped (for use with run_in_executor)"""
+    limits = threadpool_limits(DSP_THREADS) if threadpool_limits else nullcontext()
+    with lock, limits:
+        return fn(*args, **kwargs)
+
+
 class AudioStreamingBridge:
     """Simplified audio bridge for initial launch"""
     
@@ -59,7 +84,11 @@ class AudioStreamingBridge:
         self.sample_rate = 16000
         self.audio_buffer = []
         
-        if COCHLEAR_AVAILABLE:
+        # Cochlear/POM calls run in worker threads; their models keep per-instance state
+        self._cochlear_lock = threading.Lock()
+        self._pom_lock = threading.Lock()
+        
+        if _load_cochlear():
             try:
                 self.cochlear = CochlearProcessorV3()
                 logger.info("✅ Cochlear initialized")
@@ -96,26 +125,11 @@ class AudioStreamingBridge:
                 'speaker_id': 'user'
             }
             
-            # Use Cochlear Processor for transcription
-            # Note: This is a simplified call - in production you'd save to temp file
-            import tempfile
-            import wave
-            
-            # Save audio bytes to temp WAV file for processing
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
-                with wave.open(temp_file, 'wb') as wav_file:
-                    wav_file.setnchannels(1)  # Mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(self.sample_rate)
-                    wav_file.writeframes(audio_bytes)
-            
-            # Process with Cochlear Processor
-            result = self.cochlear.process_audio_human_like(temp_path, context)
-            
-            # Clean up temp file
-            import os
-            os.unlink(temp_path)
+            # Process the decoded samples directly with the Cochlear Processor
+            # (off the event loop, so other streams keep being served meanwhile)
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, _locked, self._cochlear_lock, self.cochlear.process_audio_human_like, audio_data, context
+            )
             
             transcript = result.get('transcription', {}).get('corrected', 'Transcription failed')
             confidence = result.get('transcription', {}).get('confidence_after', 0.5)
@@ -149,8 +163,16 @@ class AudioStreamingBridge:
                 return
         
         try:
+            if hasattr(self.pom, 'phonate_stream'):
+                # Synthesize in a worker thread, forwarding chunks as they are produced
+                async for chunk in self._phonate_chunks(text, **kwargs):
+                    yield chunk
+                return
+            
             # Use POM to synthesize speech
-            output_path = self.pom.phonate(text, **kwargs)
+            output_path = await asyncio.get_running_loop().run_in_executor(
+                None, partial(_locked, self._pom_lock, self.pom.phonate, text, **kwargs)
+            )
             
             # Read the synthesized audio file and stream it
             with open(output_path, 'rb') as audio_file:
@@ -158,24 +180,56 @@ class AudioStreamingBridge:
                     yield chunk
             
             # Clean up the temporary file
-            import os
             os.unlink(output_path)
             
         except Exception as e:
             logger.error(f"Speech synthesis failed: {e}")
             yield b''
     
+    async def _phonate_chunks(self, text: str, **kwargs) -> AsyncGenerator[bytes, None]:
+        """Yield 4KB chunks from `pom.phonate_stream` running in a worker thread"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_chunk(chunk: bytes):
+            loop.call_soon_threadsafe(queue.put_nowait, chunk)
+        
+        async def run():
+            try:
+                await loop.run_in_executor(
+                    None, partial(_locked, self._pom_lock, self.pom.phonate_stream, text, on_chunk, **kwargs)
+                )
+            finally:
+                queue.put_nowait(None)  # End of stream (also on failure)
+        
+        task = asyncio.create_task(run())
+        try:
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+            await task  # Surface synthesis errors
+        finally:
+            task.cancel()
+    
     def get_diagnostics(self) -> Dict:
         """Get system diagnostics"""
         # Ensure POM availability is checked
         pom_status = _load_pom() if POM_AVAILABLE is None else POM_AVAILABLE
         return {
             'status': 'operational',
-            'cochlear_available': COCHLEAR_AVAILABLE,
+            'cochlear_available': bool(COCHLEAR_AVAILABLE),
             'pom_available': pom_status,
             'cpu_mode': True
         }
 
 
-# Global instance
-audio_processor = AudioStreamingBridge()
+@lru_cache(maxsize=1)
+def get_audio_processor() -> AudioStreamingBridge:
+    """Shared bridge instance, created on first use"""
+    return AudioStreamingBridge()
+
+
+def __getattr__(name: str):
+    # Keep `from audio_streaming_bridge import audio_processor` working
+    if name == "audio_processor":
+        return get_audio_processor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -81,7 +81,7 @@ class AdaptivePlasticityEngine:
         for freq, mastery in self.frequency_mastery.items():
             if mastery > 0.8:
                 # Boost sensitivity in learned ranges
-                pf.state.frequency_sensitivity[freq] = min(1.0, pf.state.frequency_sensitivity.get(freq, 0.5) * 1.05)
+                pf.state.set_sensitivity(freq, min(1.0, pf.state.get_sensitivity(freq, 0.5) * 1.05))
         
         print(f"🧠 Hearing improved! Current mastery: {np.mean(list(self.frequency_mastery.values())):.3f}")
     
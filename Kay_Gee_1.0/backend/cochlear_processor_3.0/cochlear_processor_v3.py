@@ -4,14 +4,16 @@ from cognitive_inference import CognitiveInferenceEngine
 from correction_loop import RealtimeCorrectionLoop
 from skg_learning_bridge import SKGLearningBridge
 import numpy as np
+import os
 import time
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from typing import Dict, List, Tuple, Optional, Union
 import uuid
 
 # Adjusted imports for v2.0 compatibility
 try:
     from transcribe import asr_transcribe
-    from vault_writer import write_vault_record as vault_write_trace
+    from vault_writer import enqueue_vault_record as vault_write_trace
 except ImportError:
     # Fallback if not found
     def asr_transcribe(audio):
@@ -19,6 +21,14 @@ except ImportError:
     def vault_write_trace(trace):
         print("Vault write:", trace)
 
+# Plain libsndfile reads; librosa is only imported when soundfile can't handle a file
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+TRACE_ID_BATCH = 256
+
 class CochlearProcessorV3:
     """
     Human-like audio processing with mishearing and correction.
@@ -32,15 +42,21 @@ class CochlearProcessorV3:
         self.learning_bridge = SKGLearningBridge(self.skg, self.perceptual_filter)
         
         self.correction_callbacks = []
+        self._trace_id_pool = deque()
     
-    def process_audio_human_like(self, audio_path: str, context: Dict, speaker_id: Optional[str] = None) -> Dict:
+    def process_audio_human_like(self, audio_path: Union[str, np.ndarray], context: Dict, speaker_id: Optional[str] = None) -> Dict:
         """
         Full pipeline: perceptual filtering → transcription → inference → correction → learning
+        
+        `audio_path` may also be an already-decoded 16 kHz float array (streaming input).
         """
+        audio_source = audio_path
+        if isinstance(audio_path, np.ndarray):
+            audio_path = "<in-memory>"
         print(f"🧠 Processing audio '{audio_path}' with human-like perception...")
         
         # 1. Load audio
-        audio_data, sr = self._load_audio(audio_path)
+        audio_data, sr = self._load_audio(audio_source)
         
         # 2. Perceptual filtering (simulates ear/brain)
         filtered_audio, perceptual_report = self.perceptual_filter.apply_perceptual_filter(audio_data, context, speaker_id)
@@ -56,8 +72,7 @@ class CochlearProcessorV3:
         # 5. Real-time correction loop (insert corrections)
         final_transcript = self.correction_loop.monitor_and_correct(
             inferred_transcript,
-            on_correction=self._trigger_reresynthesis,
-            simulate_realtime=True
+            on_correction=self._trigger_reresynthesis
         )
         
         # 6. Build trace with all metadata
@@ -71,14 +86,16 @@ class CochlearProcessorV3:
             speaker_id=speaker_id
         )
         
-        # 7. Write to vault
-        vault_write_trace(trace)
-        
-        # 8. Learning: update mastery based on corrections
+        # 7. Learning: update mastery based on corrections
+        speaker = speaker_id or "unknown"
+        topic = context.get("topic", "general")
         for correction in corrections:
-            correction["speaker"] = speaker_id or "unknown"
-            correction["context"] = context.get("topic", "general")
-            self.learning_bridge.process_correction(correction)
+            correction["speaker"] = speaker
+            correction["context"] = topic
+        self.learning_bridge.process_corrections_batch(corrections)
+        
+        # 8. Write to vault (queued after the corrections are final; a background thread writes it)
+        vault_write_trace(trace)
         
         print(f"   → Final transcript: '{final_transcript[:80]}...'")
         print(f"   → Corrections made: {len(corrections)}")
@@ -86,21 +103,37 @@ class CochlearProcessorV3:
         
         return trace
     
-    def _load_audio(self, path: str) -> Tuple[np.ndarray, int]:
-        """Load audio file (placeholder: use librosa)"""
+    def _load_audio(self, path: Union[str, np.ndarray]) -> Tuple[np.ndarray, int]:
+        """Load audio file as 16 kHz mono; arrays pass through as 16 kHz samples"""
+        if isinstance(path, np.ndarray):
+            return path.astype(np.float32, copy=False), 16000
         try:
-            import librosa
-            return librosa.load(path, sr=16000)
-        except (ImportError, FileNotFoundError):
-            # Fallback: generate dummy audio for testing
-            print("⚠️  Audio file not found or librosa not available, using dummy audio")
-            # Generate 2 seconds of dummy audio
-            duration = 2.0
-            sr = 16000
-            t = np.linspace(0, duration, int(sr * duration))
-            audio = 0.5 * np.sin(2 * np.pi * 300 * t)  # 300Hz tone
-            audio += 0.3 * np.sin(2 * np.pi * 2000 * t)  # Higher frequency
-            return audio.astype(np.float32), sr
+            # Plain libsndfile read: no librosa import, no resample for 16 kHz input
+            if sf is None:
+                raise ImportError("soundfile not available")
+            audio, sr = sf.read(path, dtype='float32', always_2d=False)
+        except (ImportError, RuntimeError):
+            # soundfile missing, or a file/format libsndfile can't open (e.g. mp3)
+            try:
+                import librosa
+                return librosa.load(path, sr=16000)
+            except (ImportError, FileNotFoundError):
+                # Fallback: generate dummy audio for testing
+                print("⚠️  Audio file not found or librosa not available, using dummy audio")
+                # Generate 2 seconds of dummy audio
+                duration = 2.0
+                sr = 16000
+                t = np.linspace(0, duration, int(sr * duration))
+                audio = 0.5 * np.sin(2 * np.pi * 300 * t)  # 300Hz tone
+                audio += 0.3 * np.sin(2 * np.pi * 2000 * t)  # Higher frequency
+                return audio.astype(np.float32), sr
+        
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)  # Downmix to mono, as librosa.load does
+        if sr != 16000:
+            from scipy.signal import resample_poly
+            audio = resample_poly(audio, 16000, sr).astype(np.float32)
+        return audio, 16000
     
     def _transcribe_with_confidence(self, audio: np.ndarray, sr: int) -> Tuple[str, List[float]]:
         """
@@ -112,17 +145,21 @@ class CochlearProcessorV3:
         
         # Generate confidence scores (simulated: lower for complex words)
         words = transcript.split()
-        confidence_scores = [
-            0.9 - (len(word) * 0.01) + np.random.normal(0, 0.05)
-            for word in words
-        ]
-        confidence_scores = [max(0.1, min(1.0, c)) for c in confidence_scores]
+        word_lens = np.fromiter(map(len, words), dtype=np.float64, count=len(words))
+        noise = np.random.normal(0, 0.05, len(words))
+        confidence_scores = np.clip(0.9 - word_lens * 0.01 + noise, 0.1, 1.0)
         
-        return transcript, confidence_scores
+        return transcript, confidence_scores.tolist()
     
     def _build_enriched_trace(self, **data) -> Dict:
         """Build vault trace with all human-like processing metadata"""
-        trace = {
+        corrections = data["corrections"]
+        n = len(corrections)
+        # Plain sum/len: np.mean's array setup outweighs averaging a handful of values
+        confidence_before = sum(c["confidence_before"] for c in corrections) / n if n else 0.8
+        confidence_after = sum(c["confidence_after"] for c in corrections) / n if n else 0.8
+        
+        return {
             "trace_id": self._generate_trace_id(),
             "timestamp": time.time(),
             "processor": "cochlear_v3_human_like",
@@ -131,19 +168,16 @@ class CochlearProcessorV3:
             "transcription": {
                 "original": data["original_transcript"],
                 "corrected": data["corrected_transcript"],
-                "corrections": data["corrections"],
-                "confidence_before": np.mean([c["confidence_before"] for c in data["corrections"]]) if data["corrections"] else 0.8,
-                "confidence_after": np.mean([c["confidence_after"] for c in data["corrections"]]) if data["corrections"] else 0.8
+                "corrections": corrections,
+                "confidence_before": confidence_before,
+                "confidence_after": confidence_after
             },
             "perceptual": data["perceptual_report"],
             "context": data["context"],
-            "learning": self.learning_bridge.get_mastery_report()
+            "learning": self.learning_bridge.get_mastery_report(),
+            # Link to previous trace for causality
+            "prev_trace_id": self._get_last_trace_id()
         }
-        
-        # Link to previous trace for causality
-        trace["prev_trace_id"] = self._get_last_trace_id()
-        
-        return trace
     
     def _trigger_reresynthesis(self, wrong: str, right: str):
         """If confidence is too low, trigger re-synthesis with clearer voice"""
@@ -170,13 +204,30 @@ class CochlearProcessorV3:
         }
     
     def _generate_trace_id(self) -> str:
-        return str(uuid.uuid4())
+        """Random (version 4) UUID string, drawn from a pool filled by one urandom call per 256 IDs"""
+        try:
+            return self._trace_id_pool.popleft()
+        except IndexError:
+            raw = os.urandom(16 * TRACE_ID_BATCH)
+            self._trace_id_pool.extend(
+                str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)
+            )
+            return self._trace_id_pool.popleft()
     
     def _get_last_trace_id(self) -> str:
         # Placeholder
         return "prev_trace_123"
 
 
+def fast_frequency_masking(fft: np.ndarray, frequencies: np.ndarray,
+                           f_keys: np.ndarray, sens_vals: np.ndarray) -> np.ndarray:
+    """Scale each FFT bin by the sensitivity of the first key within 100 Hz (in place)"""
+    match = np.abs(frequencies[:, None] - f_keys[None, :]) < 100
+    first = match.argmax(axis=1)
+    fft *= np.where(match.any(axis=1), sens_vals[first], 1.0)
+    return fft
+
+
 class FastCochlearProcessor(CochlearProcessorV3):
     """
     Optimized for real-time human-like processing.
@@ -195,31 +246,25 @@ class FastCochlearProcessor(CochlearProcessorV3):
         self.asr_backend = "whisper_cpp"  # 3x faster than Python Whisper
         
     def _jit_compile_filters(self):
-        """Numba JIT compilation for perceptual filters"""
-        try:
-            from numba import jit
-            
-            @jit(nopython=True)
-            def fast_frequency_masking(fft, frequencies, sensitivity_map):
-                for i in range(len(frequencies)):
-                    freq = frequencies[i]
-                    # Linear search (fast enough for small arrays)
-                    for f_key, sens in sensitivity_map.items():
-                        if abs(freq - f_key) < 100:
-                            fft[i] *= sens
-                            break
-                    return fft
-            
-            self._fast_mask = fast_frequency_masking
-        except ImportError:
-            self._fast_mask = None
+        """Bind the vectorized perceptual frequency mask"""
+        self._fast_mask = fast_frequency_masking
     
     def process_chunked(self, audio_stream, chunk_size=1600):
         """
         Process audio in small chunks for real-time performance.
+        
+        Each chunk is copied into the preallocated `audio_buffer`, which is
+        reused for the next chunk, so downstream code must not keep references
+        to the chunk array.
         """
-        for i in range(0, len(audio_stream), chunk_size):
-            chunk = audio_stream[i:i+chunk_size]
+        if chunk_size > len(self.audio_buffer):
+            self.audio_buffer = np.zeros(chunk_size)
+        buf = self.audio_buffer
+        total = len(audio_stream)
+        for i in range(0, total, chunk_size):
+            n = min(chunk_size, total - i)
+            chunk = buf[:n]
+            np.copyto(chunk, audio_stream[i:i+n])
             
             # Fast path: minimal processing if confidence is high
             if self._should_use_fast_path(chunk):
@@ -302,9 +347,7 @@ class HumanHearingProfile:
         
         # Adjust frequency sensitivity
         if profile["frequency_sensitivity"] == "reduced_high_freq":
-            for f in pf.state.frequency_sensitivity:
-                if f > 8000:
-                    pf.state.frequency_sensitivity[f] *= 0.5
+            pf.state.sens[pf.state.freqs > 8000] *= 0.5
         
         processor.correction_loop.callback_threshold = profile["confidence"]
         processor.cognitive_engine.confidence_threshold = profile["confidence"]
\ No newline at end of file
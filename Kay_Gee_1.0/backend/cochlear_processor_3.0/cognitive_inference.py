@@ -1,6 +1,85 @@
-import difflib
 from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
+from rapidfuzz.distance import Levenshtein
+
+# Sounds-like dictionary (in production: use phoneme embedding database)
+PHONETIC_DICTIONARY = ("the", "be", "to", "of", "and", "a", "in", "that", "have", "I")
+
+# Simple n-gram model: (context suffix, predicted next word), highest priority first
+CONTEXT_RULES = (
+    ("to", "be"),
+    ("I", "am"),
+    # Add more patterns...
+)
+
+def _build_suffix_trie(rules) -> Dict:
+    """Trie over reversed suffixes; a node's None key holds (priority, prediction)"""
+    root = {}
+    for priority, (suffix, prediction) in enumerate(rules):
+        node = root
+        for ch in reversed(suffix):
+            node = node.setdefault(ch, {})
+        node.setdefault(None, (priority, prediction))
+    return root
+
+_CONTEXT_SUFFIX_TRIE = _build_suffix_trie(CONTEXT_RULES)
+_MAX_CONTEXT_SUFFIX = max(len(suffix) for suffix, _ in CONTEXT_RULES)
+
+class BKTree:
+    """
+    Burkhard-Keller tree over Levenshtein distance.
+    Finds all words within a distance bound without scanning the whole dictionary.
+    """
+    
+    def __init__(self, words):
+        self._root = None  # [word, order, {distance: child}]
+        self._size = 0
+        for word in words:
+            self.add(word)
+    
+    def add(self, word: str):
+        node = [word, self._size, {}]
+        self._size += 1
+        if self._root is None:
+            self._root = node
+            return
+        current = self._root
+        while True:
+            d = Levenshtein.distance(word, current[0])
+            if d == 0:
+                return  # Already present
+            child = current[2].get(d)
+            if child is None:
+                current[2][d] = node
+                return
+            current = child
+    
+    def find(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """(distance, word) pairs within `max_distance`, closest first (ties in insertion order)"""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            candidate, order, children = stack.pop()
+            d = Levenshtein.distance(word, candidate)
+            if d <= max_distance:
+                found.append((d, order, candidate))
+            # Triangle inequality: only subtrees at distance d±max_distance can match
+            for child_d, child in children.items():
+                if d - max_distance <= child_d <= d + max_distance:
+                    stack.append(child)
+        found.sort()
+        return [(d, candidate) for d, _, candidate in found]
+
+# Built once; neighbor queries visit only the subtrees that can match
+_PHONETIC_INDEX = BKTree(PHONETIC_DICTIONARY)
+
+@lru_cache(maxsize=4096)
+def _phonetic_neighbors_cached(word: str, max_distance: int) -> Tuple[str, ...]:
+    """Dictionary words within `max_distance` of `word`, closest first (memoized)"""
+    return tuple(w for _, w in _PHONETIC_INDEX.find(word, max_distance))
 
 class CognitiveInferenceEngine:
     """
@@ -60,7 +139,7 @@ class CognitiveInferenceEngine:
             sources["phonetic"] = phonetic_candidates
         
         # 2. Contextual prediction (n-gram probability)
-        context = " ".join(self.context_window)
+        context = self._context_tail()
         context_pred = self._contextual_prediction(context, position)
         if context_pred:
             sources["context"] = context_pred
@@ -89,20 +168,37 @@ class CognitiveInferenceEngine:
         return inferred, sources
     
     def _phonetic_neighbors(self, word: str, max_distance: int = 2) -> List[str]:
-        """Words within Levenshtein distance of 2 (sounds-like)"""
-        # In production: use phoneme embedding database
-        common_words = ["the", "be", "to", "of", "and", "a", "in", "that", "have", "I"]
-        return [w for w in common_words if difflib.SequenceMatcher(None, word, w).ratio() > 0.7]
+        """Words within Levenshtein distance `max_distance` (sounds-like), closest first"""
+        # Misheard words recur (Zipfian), so most lookups are cache hits
+        return list(_phonetic_neighbors_cached(word, max_distance))
+    
+    def _context_tail(self) -> str:
+        """
+        End of `" ".join(self.context_window)`, long enough for every context rule.
+        Joins only the last few words instead of the whole 50-word window per lookup.
+        """
+        parts = []
+        size = -1
+        for word in reversed(self.context_window):
+            parts.append(word)
+            size += len(word) + 1
+            if size >= _MAX_CONTEXT_SUFFIX:
+                break
+        return " ".join(reversed(parts))
     
     def _contextual_prediction(self, context: str, position: int) -> Optional[str]:
         """Predict next word based on preceding context"""
-        # Simple n-gram model
-        if context.endswith("to"):
-            return "be"
-        elif context.endswith("I"):
-            return "am"
-        # Add more patterns...
-        return None
+        # Walk the context backwards once; every rule whose suffix matches is on the path
+        best = None
+        node = _CONTEXT_SUFFIX_TRIE
+        for i in range(len(context) - 1, -1, -1):
+            node = node.get(context[i])
+            if node is None:
+                break
+            hit = node.get(None)
+            if hit is not None and (best is None or hit < best):
+                best = hit
+        return best[1] if best else None
     
     def _semantic_coherence(self, words: List[str]) -> Optional[str]:
         """Check topic consistency"""
@@ -114,17 +210,14 @@ class CognitiveInferenceEngine:
     
     def _cross_validate(self, sources: Dict) -> str:
         """Pick word that appears in multiple inference sources"""
-        all_candidates = []
+        # Tally in one pass, without collecting the candidates first
+        counts = {}
         for candidates in sources.values():
-            if isinstance(candidates, list):
-                all_candidates.extend(candidates)
-            else:
-                all_candidates.append(candidates)
+            for word in (candidates if isinstance(candidates, list) else (candidates,)):
+                counts[word] = counts.get(word, 0) + 1
         
-        # Return most frequent candidate
-        from collections import Counter
-        counts = Counter(all_candidates)
-        return counts.most_common(1)[0][0]
+        # Return most frequent candidate (earliest seen wins ties, as with Counter.most_common)
+        return max(counts, key=counts.__getitem__)
     
     def _estimate_confidence(self, word: str) -> float:
         """Estimated confidence after inference (0.0-1.0)"""
@@ -1,6 +1,16 @@
-import time
+import random
+from collections import deque
 import numpy as np
-from typing import Dict, List, Callable
+from typing import Dict, Iterator, List, Callable, Optional, Tuple
+
+# Human-like correction markers, formatted with the misheard/corrected words
+CORRECTION_PHRASES = (
+    "Sorry, I meant {right}, not {wrong}.",
+    "No, wait—{right}.",
+    "Actually, {right}.",
+    "I'm hearing that as {right}.",
+    "Correction: {right}.",
+)
 
 class RealtimeCorrectionLoop:
     """
@@ -10,31 +20,51 @@ class RealtimeCorrectionLoop:
     def __init__(self, processor):
         self.processor = processor  # Reference to the full processor
         self.correction_buffer = []
-        self.confidence_history = []
+        self.confidence_history = deque(maxlen=5)  # Only the recent window is consulted
         self.callback_threshold = 0.5  # Below this, trigger correction
     
     def monitor_and_correct(self, text_stream: str, 
                           on_correction: Callable[[str, str], None],
-                          simulate_realtime: bool = True):
+                          simulate_realtime: bool = True) -> str:
         """
         Watches transcription confidence and triggers corrections when needed.
+        `simulate_realtime` is deprecated and ignored; corrections no longer pause.
         """
-        words = text_stream.split()
         corrected_stream = []
+        for word, corrected_word, correction_phrase in self._iter_corrections(text_stream, on_correction):
+            if correction_phrase is None:
+                corrected_stream.append(word)
+            else:
+                corrected_stream.append(correction_phrase)
+                corrected_stream.append(corrected_word)
+        
+        return " ".join(corrected_stream)
+    
+    def _iter_corrections(self, text_stream: str,
+                          on_correction: Callable[[str, str], None]) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yields (word, corrected_word, correction_phrase or None) per word of the stream"""
+        words = text_stream.split()
+        
+        # Perceptual state doesn't change while the stream is monitored: read it once
+        attention = self.processor.perceptual_filter.state.attention_level
+        perceptual_report = {
+            "dropouts": [],  # No dropouts for correction inference
+            "attention_level": attention
+        }
+        infer_word = self.processor.cognitive_engine._infer_word
+        threshold = self.callback_threshold
+        
+        # Get confidence from perceptual filter, for every position at once
+        confidences = self._get_word_confidences(len(words), attention)
         
         for i, word in enumerate(words):
-            # Get confidence from perceptual filter
-            confidence = self._get_word_confidence(word, i)
+            confidence = confidences[i]
             self.confidence_history.append(confidence)
             
             # Human-like: sometimes we *realize* we misheard
-            if confidence < self.callback_threshold and self._should_correct():
+            if confidence < threshold and self._should_correct():
                 # Try to infer correct word
-                perceptual_report = {
-                    "dropouts": [],  # No dropouts for correction inference
-                    "attention_level": self.processor.perceptual_filter.state.attention_level
-                }
-                corrected_word, _ = self.processor.cognitive_engine._infer_word(
+                corrected_word, _ = infer_word(
                     word, i, words[:i+1], perceptual_report
                 )
                 
@@ -42,54 +72,37 @@ class RealtimeCorrectionLoop:
                     # Insert correction in human-like way
                     correction_phrase = self._generate_correction_phrase(word, corrected_word)
                     
-                    if simulate_realtime:
-                        # Simulate pause before correction (human catching themselves)
-                        time.sleep(0.3)
-                    
-                    corrected_stream.append(correction_phrase)
-                    corrected_stream.append(corrected_word)
-                    
                     # Notify upstream (could trigger re-synthesis)
                     on_correction(word, corrected_word)
                     
                     # Reset confidence
                     self.confidence_history.append(0.8)  # Post-correction confidence
-                else:
-                    corrected_stream.append(word)
-            else:
-                corrected_stream.append(word)
-        
-        return " ".join(corrected_stream)
+                    
+                    yield word, corrected_word, correction_phrase
+                    continue
+            
+            yield word, word, None
     
     def _should_correct(self) -> bool:
         """Humans don't correct *every* mishearing—only when they notice"""
         # Probability increases with recent low confidence
-        recent_confidence = np.mean(self.confidence_history[-5:])
-        return np.random.random() < (1 - recent_confidence)
+        # (plain float math: numpy dispatch costs more than averaging 5 values)
+        history = self.confidence_history
+        recent_confidence = sum(history) / len(history)
+        return random.random() < (1 - recent_confidence)
     
     def _generate_correction_phrase(self, wrong: str, right: str) -> str:
         """Human-like correction markers"""
-        phrases = [
-            f"Sorry, I meant {right}, not {wrong}.",
-            f"No, wait—{right}.",
-            f"Actually, {right}.",
-            f"I'm hearing that as {right}.",
-            f"Correction: {right}."
-        ]
-        return np.random.choice(phrases)
+        # Pick a template first so only one phrase gets formatted
+        return random.choice(CORRECTION_PHRASES).format(wrong=wrong, right=right)
     
-    def _get_word_confidence(self, word: str, position: int) -> float:
-        """Simulated confidence based on perceptual state"""
-        if not hasattr(self, 'perceptual_filter'):
-            self.perceptual_filter = self.processor.perceptual_filter
-        
-        # Simulated: real confidence would come from ASR
-        base_confidence = 0.7
-        
-        # Attention effect
-        attention_factor = self.processor.perceptual_filter.state.attention_level
+    def _get_word_confidences(self, n_words: int, attention_factor: float,
+                              base_confidence: float = 0.7) -> List[float]:
+        """Simulated per-position confidence based on perceptual state"""
+        # Simulated: real confidence would come from ASR; attention scales the base
         
-        # Dropout penalty
-        dropout_penalty = 0.2 if position % 10 == 0 else 0
+        # Dropout penalty every 10th position
+        dropout_penalty = np.where(np.arange(n_words) % 10 == 0, 0.2, 0.0)
         
-        return max(0.1, base_confidence * attention_factor - dropout_penalty)
\ No newline at end of file
+        # Plain floats so the history stays cheap to average
+        return np.maximum(0.1, base_confidence * attention_factor - dropout_penalty).tolist()
\ No newline at end of file
@@ -6,10 +6,31 @@ from typing import Tuple, Dict, Optional
 @dataclass
 class PerceptualState:
     attention_level: float = 0.8          # 0.0-1.0 (fatigued to hyper-focused)
-    frequency_sensitivity: Dict[float, float] = None  # Hz: sensitivity
+    freqs: np.ndarray = None              # Sensitivity curve points, Hz (ascending)
+    sens: np.ndarray = None               # Sensitivity at each of `freqs`
     recent_phoneme_memory: list = None    # Last 10 phonemes for context
     confidence_decay: float = 0.95        # Temporal decay factor
     
+    def as_dict(self) -> Dict[float, float]:
+        """Frequency sensitivity as a {Hz: sensitivity} mapping"""
+        return dict(zip(self.freqs.tolist(), self.sens.tolist()))
+    
+    def get_sensitivity(self, freq: float, default: float = None) -> Optional[float]:
+        """Sensitivity stored at exactly `freq`, or `default`"""
+        i = int(np.searchsorted(self.freqs, freq))
+        if i < len(self.freqs) and self.freqs[i] == freq:
+            return float(self.sens[i])
+        return default
+    
+    def set_sensitivity(self, freq: float, value: float):
+        """Set sensitivity at `freq`, adding it to the curve if new"""
+        i = int(np.searchsorted(self.freqs, freq))
+        if i < len(self.freqs) and self.freqs[i] == freq:
+            self.sens[i] = value
+        else:
+            self.freqs = np.insert(self.freqs, i, freq)
+            self.sens = np.insert(self.sens, i, value)
+    
 class HumanPerceptualFilter:
     """
     Simulates biological hearing limitations and attention effects.
@@ -22,12 +43,10 @@ class HumanPerceptualFilter:
         
     def _init_frequency_sensitivity(self):
         """Human ear is most sensitive at 2-5 kHz; less at extremes"""
-        self.state.frequency_sensitivity = {
-            # Normal human hearing range: 20Hz-20kHz
-            # Sensitivity modeled as inverted U-curve
-            20: 0.10, 100: 0.30, 500: 0.60, 2000: 1.0,  # Peak sensitivity
-            5000: 1.0, 10000: 0.70, 15000: 0.40, 20000: 0.15
-        }
+        # Normal human hearing range: 20Hz-20kHz
+        # Sensitivity modeled as inverted U-curve
+        self.state.freqs = np.array([20, 100, 500, 2000, 5000, 10000, 15000, 20000], dtype=np.float64)
+        self.state.sens = np.array([0.10, 0.30, 0.60, 1.0, 1.0, 0.70, 0.40, 0.15])  # Peak at 2-5 kHz
     
     def apply_perceptual_filter(self, audio_chunk: np.ndarray, 
                               attention_override: float = None) -> Tuple[np.ndarray, Dict]:
@@ -66,9 +85,7 @@ class HumanPerceptualFilter:
         freqs = np.fft.rfftfreq(len(audio), 1/self.sample_rate)
         
         # Apply sensitivity curve
-        for i, freq in enumerate(freqs):
-            sensitivity = self._interpolate_sensitivity(freq)
-            fft[i] *= sensitivity * self.state.attention_level
+        fft *= self._interpolate_sensitivity(freqs) * self.state.attention_level
         
         # IFFT back to time domain
         return np.fft.irfft(fft)
@@ -105,15 +122,9 @@ class HumanPerceptualFilter:
     
     def _calculate_attenuation(self) -> Dict:
         """Calculate frequency band attenuation applied"""
-        return {f"{freq}Hz": 1.0 - sens for freq, sens in self.state.frequency_sensitivity.items()}
+        return {f"{freq:g}Hz": 1.0 - sens for freq, sens in self.state.as_dict().items()}
     
-    def _interpolate_sensitivity(self, freq: float) -> float:
-        """Linear interpolation of frequency sensitivity curve"""
-        freqs = sorted(self.state.frequency_sensitivity.keys())
-        for i in range(len(freqs) - 1):
-            if freqs[i] <= freq <= freqs[i+1]:
-                low, high = freqs[i], freqs[i+1]
-                sens_low = self.state.frequency_sensitivity[low]
-                sens_high = self.state.frequency_sensitivity[high]
-                return sens_low + (sens_high - sens_low) * ((freq - low) / (high - low))
-        return 0.1  # Default for out-of-range
\ No newline at end of file
+    def _interpolate_sensitivity(self, freq):
+        """Linear interpolation of frequency sensitivity curve (scalar or array of Hz)"""
+        # 0.1 default for out-of-range
+        return np.interp(freq, self.state.freqs, self.state.sens, left=0.1, right=0.1)
\ No newline at end of file
@@ -90,9 +90,8 @@ class SKGPerceptualFilter(HumanPerceptualFilter):
         
         # Adjust frequency sensitivity to speaker's dominant range
         dominant_freq = profile["dominant_frequency"]
-        for f in self.state.frequency_sensitivity:
-            if abs(f - dominant_freq) < 500:  # Within 500Hz
-                self.state.frequency_sensitivity[f] *= 1.2  # Boost
+        near = np.abs(self.state.freqs - dominant_freq) < 500  # Within 500Hz
+        self.state.sens[near] *= 1.2  # Boost
     
     def _apply_contextual_attention_weights(self, context: Dict):
         """Increase attention if context contains important keywords"""
@@ -148,6 +147,6 @@ class SKGPerceptualFilter(HumanPerceptualFilter):
         enhancements = []
         if self.state.attention_level > 0.85:
             enhancements.append("high_attention_mode")
-        if any(s > 1.1 for s in self.state.frequency_sensitivity.values()):
+        if (self.state.sens > 1.1).any():
             enhancements.append("speaker_frequency_boost")
         return enhancements
\ No newline at end of file
@@ -3,7 +3,11 @@ ASR Transcription Module using faster-whisper
 CPU-ONLY MODE
 """
 import logging
-from typing import Union
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Union
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -17,20 +21,38 @@ except ImportError:
     WHISPER_AVAILABLE = False
     logger.warning("⚠️ Faster-whisper not available")
 
-# Global model instance (lazy loading)
+# Global model instance (warm-loaded in the background at import)
 _model = None
+_model_ready = threading.Event()
 
-def get_whisper_model():
-    """Lazy load the Whisper model"""
+# One model serves this many concurrent transcribe calls, splitting the cores between them
+_TRANSCRIBE_WORKERS = 2
+_CPU_THREADS_PER_WORKER = max(1, (os.cpu_count() or 4) // _TRANSCRIBE_WORKERS)
+
+# Throughput-oriented decoding for the tiny CPU model: skip silence, greedy search,
+# and no cross-segment conditioning (segments decode independently)
+_TRANSCRIBE_OPTIONS = {"vad_filter": True, "beam_size": 1, "condition_on_previous_text": False}
+
+def _load_whisper_model():
+    """Load the Whisper model and signal waiters (runs on a background thread)"""
     global _model
-    if _model is None and WHISPER_AVAILABLE:
-        try:
-            # Use CPU-only, small model for speed
-            _model = WhisperModel("tiny", device="cpu", compute_type="int8")
-            logger.info("✅ Whisper model loaded (tiny, CPU)")
-        except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
-            _model = None
+    try:
+        # Use CPU-only, small model for speed; workers let concurrent transcribe
+        # calls run in parallel instead of queueing behind each other
+        _model = WhisperModel("tiny", device="cpu", compute_type="int8",
+                              cpu_threads=_CPU_THREADS_PER_WORKER, num_workers=_TRANSCRIBE_WORKERS)
+        logger.info("✅ Whisper model loaded (tiny, CPU)")
+    except Exception as e:
+        logger.error(f"Failed to load Whisper model: {e}")
+        _model = None
+    finally:
+        _model_ready.set()
+
+def get_whisper_model():
+    """Return the Whisper model, waiting for the background warm-load if still running"""
+    if not WHISPER_AVAILABLE:
+        return None
+    _model_ready.wait()
     return _model
 
 def asr_transcribe(audio: Union[str, np.ndarray], language: str = "en") -> str:
@@ -49,21 +71,33 @@ def asr_transcribe(audio: Union[str, np.ndarray], language: str = "en") -> str:
         return "Speech recognition unavailable"
 
     try:
-        if isinstance(audio, str):
-            # Audio is a file path
-            segments, info = model.transcribe(audio, language=language)
-        else:
-            # Audio is a numpy array
-            segments, info = model.transcribe(audio, language=language)
-
-        # Collect all text segments
-        text = " ".join([segment.text for segment in segments])
+        # Audio is a file path or a numpy array; both go straight to the model
+        segments, info = model.transcribe(audio, language=language, **_TRANSCRIBE_OPTIONS)
+
+        # Collect all text segments as the generator decodes them
+        text = " ".join(segment.text for segment in segments)
         return text.strip()
 
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         return f"Transcription error: {str(e)}"
 
+def asr_transcribe_batch(chunks: List[Union[str, np.ndarray]], language: str = "en") -> List[str]:
+    """
+    Transcribe independent audio chunks in parallel
+
+    Args:
+        chunks: File paths or numpy arrays (e.g. VAD-separated clips of a long stream)
+        language: Language code (default: "en")
+
+    Returns:
+        Transcribed text per chunk, in input order
+    """
+    if not chunks:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_TRANSCRIBE_WORKERS, len(chunks))) as executor:
+        return list(executor.map(partial(asr_transcribe, language=language), chunks))
+
 def asr_transcribe_with_timestamps(audio: Union[str, np.ndarray], language: str = "en") -> dict:
     """
     Transcribe audio with timestamps
@@ -76,21 +110,27 @@ def asr_transcribe_with_timestamps(audio: Union[str, np.ndarray], language: str
         return {"text": "Speech recognition unavailable", "segments": []}
 
     try:
-        segments, info = model.transcribe(audio, language=language)
+        segments, info = model.transcribe(audio, language=language, **_TRANSCRIBE_OPTIONS)
 
+        # `segments` is a one-shot generator: decode it once, then derive the text
+        timed_segments = [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text
+            }
+            for segment in segments
+        ]
         result = {
-            "text": " ".join([segment.text for segment in segments]),
-            "segments": [
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text
-                }
-                for segment in segments
-            ]
+            "text": " ".join(segment["text"] for segment in timed_segments),
+            "segments": timed_segments
         }
         return result
 
     except Exception as e:
         logger.error(f"Transcription with timestamps failed: {e}")
-        return {"text": f"Transcription error: {str(e)}", "segments": []}
\ No newline at end of file
+        return {"text": f"Transcription error: {str(e)}", "segments": []}
+
+# Start loading now so the first transcription doesn't pay for model init
+if WHISPER_AVAILABLE:
+    threading.Thread(target=_load_whisper_model, name="whisper-warmup", daemon=True).start()
@@ -2,12 +2,18 @@
 Vault Writer Module for Cochlear Processor
 Integrates with KayGee's TraceVault system
 """
+import atexit
 import logging
+import queue
+import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Tuple
 import time
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Try to import KayGee's vault system
@@ -47,13 +53,13 @@ def write_vault_record(trace: Dict[str, Any]) -> str:
     vault = get_trace_vault()
     if not vault:
         logger.warning("TraceVault not available, logging trace to console")
-        print(f"VAULT RECORD: {json.dumps(trace, indent=2)}")
+        sys.stdout.write(f"VAULT RECORD: {orjson.dumps(trace, option=orjson.OPT_SERIALIZE_NUMPY).decode()}\n")
         return "no_vault"
 
     try:
-        # Add timestamp if not present
+        # Add timestamp (integer nanoseconds) if not present
         if 'timestamp' not in trace:
-            trace['timestamp'] = time.time()
+            trace['timestamp'] = time.time_ns()
 
         # Write to vault
         merkle_root = vault.append(trace)
@@ -64,6 +70,100 @@ def write_vault_record(trace: Dict[str, Any]) -> str:
         logger.error(f"Failed to write to vault: {e}")
         return f"error_{str(e)}"
 
+def write_vault_records(traces: List[Dict[str, Any]]) -> List[str]:
+    """
+    Write several trace records to the vault in one append
+
+    Args:
+        traces: The trace data to write, in order
+
+    Returns:
+        Merkle root hash per written block
+    """
+    vault = get_trace_vault()
+    if not vault or not hasattr(vault, "append_many"):
+        return [write_vault_record(trace) for trace in traces]
+
+    try:
+        # One clock read per batch; the per-record offset keeps stamps unique and in order
+        base_ns = time.time_ns()
+        for offset, trace in enumerate(traces):
+            trace.setdefault('timestamp', base_ns + offset)
+
+        merkle_roots = vault.append_many(traces)
+        logger.info(f"✅ {len(merkle_roots)} traces written to vault")
+        return merkle_roots
+
+    except Exception as e:
+        logger.error(f"Failed to write to vault: {e}")
+        return [f"error_{str(e)}"] * len(traces)
+
+# Background writer: traces are written in submission order by a single thread,
+# grouped into batches of up to WRITE_BATCH_SIZE or whatever arrives within WRITE_BATCH_WAIT
+WRITE_BATCH_SIZE = 64
+WRITE_BATCH_WAIT = 0.05  # seconds
+
+_write_queue: "queue.Queue[Tuple[Dict[str, Any], Future]]" = queue.Queue()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+def _next_write_batch() -> List[Tuple[Dict[str, Any], Future]]:
+    batch = [_write_queue.get()]
+    deadline = time.monotonic() + WRITE_BATCH_WAIT
+    while len(batch) < WRITE_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_write_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+def _drain_write_queue():
+    while True:
+        batch = _next_write_batch()
+        try:
+            merkle_roots = write_vault_records([trace for trace, _ in batch])
+            for (_, future), merkle_root in zip(batch, merkle_roots):
+                future.set_result(merkle_root)
+        except Exception as e:
+            logger.error(f"Queued vault write failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for _ in batch:
+                _write_queue.task_done()
+
+def enqueue_vault_record(trace: Dict[str, Any]) -> Future:
+    """
+    Queue a trace record for writing in the background
+
+    Records are written by one writer thread in FIFO order, so per-speaker
+    ordering is preserved. Pending records are flushed at interpreter exit.
+
+    Args:
+        trace: The trace data to write (must not be mutated afterwards)
+
+    Returns:
+        Future resolving to the merkle root of the written block
+    """
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(target=_drain_write_queue, name="vault-writer", daemon=True)
+                _writer_thread.start()
+                atexit.register(flush_vault_records)
+    future: Future = Future()
+    _write_queue.put((trace, future))
+    return future
+
+def flush_vault_records() -> None:
+    """Block until every queued trace record has been written"""
+    _write_queue.join()
+
 def query_vault_records(filters: Dict[str, Any] = None, limit: int = 10) -> list:
     """
     Query vault records
@@ -7,13 +7,20 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import asyncio
-import json
+import os
+import re
+import secrets
 import time
 import random
-from typing import List, Dict, Any, Optional
+from collections import deque
+from functools import partial
+from typing import Deque, List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # ========== SETTINGS ==========
 API_PORT = 8000
 CORS_ORIGINS = [
@@ -51,46 +58,103 @@ class ResonanceSignature(BaseModel):
 # ========== MOCK DATA GENERATORS ==========
 COMPONENT_NAMES = ["locke", "hume", "kant", "spinoza", "soft_max", "perception", "skeptic", "synthesis", "action", "integrity", "memory"]
 
+# Per-component values are drawn for all components at once
+_RNG = np.random.default_rng()
+
+# ========== KEYWORD ROUTING ==========
+# /speak topic check (substring match, as before)
+SPEAK_VOICE_RE = re.compile(r"pom|voice")
+SPEAK_RESPONSES = (
+    "Processing through epistemic convergence matrix... Skeptic module verified logical consistency.",
+    "Multiple SKGs converged on solution with 94% confidence. Trace vault updated.",
+    "Memory consolidation queue updated. Active reasoning threads: 3",
+    "Reasoning depth: 5. Phase coherence: 0.92. Harmonic lock achieved.",
+    "Adversarial trial passed. Confidence calibrated. Ready for next query."
+)
+
+# Orb intents in priority order: (keywords, emotion, response)
+ORB_INTENTS = (
+    (("hello", "hi", "greetings", "good morning"), "happy",
+     "Hello! I'm KayGee, your cognitive companion. How can I assist you today?"),
+    (("help", "assist", "support"), "focused",
+     "I'm here to help. I can analyze information, provide reasoning, or assist with decision-making. What would you like to explore?"),
+    (("status", "how are you", "system"), "calm",
+     "All cognitive systems are operational. Resonance levels stable at 87%. Ready for interaction."),
+    (("thank", "thanks", "appreciate"), "happy",
+     "You're welcome! I'm glad I could be of assistance."),
+)
+ORB_CURIOUS_RESPONSES = (
+    "Interesting query. Let me process that through my reasoning matrix.",
+    "Analyzing your input... Multiple cognitive pathways activated.",
+    "Processing through epistemic convergence... Skeptic modules engaged.",
+    "Your question has triggered deep reasoning analysis. Stand by for response."
+)
+ORB_KEYWORD_INTENT = {keyword: i for i, (keywords, _, _) in enumerate(ORB_INTENTS) for keyword in keywords}
+# One scan for every keyword with the same substring semantics as the original `in` checks
+# ("helping", "systems" and "this" still match); the lookahead reports overlapping hits
+ORB_KEYWORD_RE = re.compile(
+    r"(?=(" + "|".join(map(re.escape, ORB_KEYWORD_INTENT)) + r"))"
+)
+
+def match_orb_intent(text_lower: str) -> Optional[int]:
+    """Index into ORB_INTENTS of the highest-priority intent mentioned, or None"""
+    intents = {ORB_KEYWORD_INTENT[keyword] for keyword in ORB_KEYWORD_RE.findall(text_lower)}
+    return min(intents) if intents else None
+
 def generate_cognitive_status() -> Dict[str, Any]:
     """Generate realistic cognitive status"""
-    components = {}
-    for name in COMPONENT_NAMES:
-        confidence = random.uniform(0.75, 0.98)
-        components[name] = {
-            "initialized": random.choice([True, True, True, False]),
-            "status": {"mode": "active", "last_sync": time.time()},
-            "last_update": time.time(),
-            "error_count": random.randint(0, 3),
-            "confidence_score": confidence
+    n = len(COMPONENT_NAMES)
+    confidence = _RNG.uniform(0.75, 0.98, n).tolist()
+    initialized = (_RNG.integers(0, 4, n) != 3).tolist()  # 3 in 4 initialized
+    error_count = _RNG.integers(0, 4, n).tolist()
+    now = time.time()
+    
+    components = {
+        name: {
+            "initialized": initialized[i],
+            "status": {"mode": "active", "last_sync": now},
+            "last_update": now,
+            "error_count": error_count[i],
+            "confidence_score": confidence[i]
         }
+        for i, name in enumerate(COMPONENT_NAMES)
+    }
     
     return {
         "status": random.choice(["online", "online", "degraded"]),
-        "session_id": f"session_{random.randint(1000, 9999)}_{int(time.time())}",
+        "session_id": f"session_{secrets.token_hex(8)}",
         "interaction_count": random.randint(50, 500),
         "components": components,
         "active_reasoning_threads": random.randint(1, 8),
         "memory_consolidation_queue": random.randint(0, 20),
-        "timestamp": time.time()
+        "timestamp": now
     }
 
 def generate_health_status() -> Dict[str, Any]:
     """Generate detailed health metrics"""
-    components = {}
-    for name in COMPONENT_NAMES:
-        health_score = random.uniform(0.75, 0.98)
-        components[name] = {
-            "health_score": health_score,
-            "healthy": health_score > 0.7,
-            "latency_ms": random.randint(10, 150),
-            "last_check": time.time(),
-            "circuit_breaker": "closed" if health_score > 0.8 else "half_open" if health_score > 0.6 else "open"
+    n = len(COMPONENT_NAMES)
+    health = _RNG.uniform(0.75, 0.98, n)
+    healthy = (health > 0.7).tolist()
+    circuit_breaker = np.select([health > 0.8, health > 0.6], ["closed", "half_open"], "open").tolist()
+    latency_ms = _RNG.integers(10, 151, n).tolist()
+    health_score = health.tolist()
+    now = time.time()
+    
+    components = {
+        name: {
+            "health_score": health_score[i],
+            "healthy": healthy[i],
+            "latency_ms": latency_ms[i],
+            "last_check": now,
+            "circuit_breaker": circuit_breaker[i]
         }
+        for i, name in enumerate(COMPONENT_NAMES)
+    }
     
     return {
         "overall_health": random.uniform(0.80, 0.95),
         "components": components,
-        "timestamp": time.time(),
+        "timestamp": now,
         "trend": random.choice(["up", "stable", "down"])
     }
 
@@ -131,7 +195,7 @@ def generate_adversarial_trials(limit: int = 50) -> List[Dict[str, Any]]:
     for i in range(min(limit, random.randint(8, 20))):
         success = random.random() > 0.3
         trials.append({
-            "id": f"trial_{i}_{random.randint(1000, 9999)}",
+            "id": f"trial_{secrets.token_hex(8)}",
             "name": random.choice(trial_names),
             "success": success,
             "duration_ms": random.randint(200, 2000),
@@ -148,33 +212,36 @@ def generate_adversarial_trials(limit: int = 50) -> List[Dict[str, Any]]:
         })
     return sorted(trials, key=lambda x: x["timestamp"], reverse=True)
 
+LOG_LEVELS = ["INFO", "DEBUG", "WARN", "ERROR"]
+LOG_COMPONENTS = ["vaults", "reasoning", "perception", "articulation", "integrity", "memory", "skeptic"]
+LOG_ERRORS = ['Vault sync failed', 'Reasoning timeout', 'Perception mismatch', 'Integrity violation']
+
+# Message builders per level (timestamp, component); only the chosen level's values are drawn
+LOG_TEMPLATES = {
+    "INFO": lambda t, c: f"[{t}] INFO:{c} - Processing completed successfully (confidence: {random.uniform(0.8, 0.95):.2f})",
+    "DEBUG": lambda t, c: f"[{t}] DEBUG:{c} - Memory consolidation triggered, {random.randint(1, 5)} items processed",
+    "WARN": lambda t, c: f"[{t}] WARN:{c} - High latency detected ({random.randint(50, 200)}ms)",
+    "ERROR": lambda t, c: f"[{t}] ERROR:{c} - {random.choice(LOG_ERRORS)}",
+}
+
 def generate_logs(limit: int = 100, filters: Dict[str, str] = None) -> List[str]:
     """Generate mock system logs"""
-    log_levels = ["INFO", "DEBUG", "WARN", "ERROR"]
-    components = ["vaults", "reasoning", "perception", "articulation", "integrity", "memory", "skeptic"]
-    
-    logs = []
-    for i in range(limit):
-        level = random.choice(log_levels)
-        component = random.choice(components)
-        timestamp = (datetime.now() - timedelta(seconds=i*30)).strftime("%H:%M:%S")
-        
-        if filters and filters.get('level') and level != filters['level'].upper():
-            continue
-        if filters and filters.get('component') and component != filters['component']:
-            continue
-            
-        messages = {
-            "INFO": f"[{timestamp}] INFO:{component} - Processing completed successfully (confidence: {random.uniform(0.8, 0.95):.2f})",
-            "DEBUG": f"[{timestamp}] DEBUG:{component} - Memory consolidation triggered, {random.randint(1, 5)} items processed",
-
-            "WARN": f"[{timestamp}] WARN:{component} - High latency detected ({random.randint(50, 200)}ms)",
-
-            "ERROR": f"[{timestamp}] ERROR:{component} - {random.choice(['Vault sync failed', 'Reasoning timeout', 'Perception mismatch', 'Integrity violation'])}"
-        }
-        logs.append(messages[level])
-    
-    return logs
+    filters = filters or {}
+    level_filter = (filters.get('level') or '').upper()
+    component_filter = filters.get('component')
+    
+    levels = random.choices(LOG_LEVELS, k=limit)
+    components = random.choices(LOG_COMPONENTS, k=limit)
+    # Local-time stamps 30 s apart, formatted in one pass ("YYYY-MM-DDTHH:MM:SS")
+    now = np.datetime64(datetime.now(), 's')
+    stamps = np.datetime_as_string(now - np.arange(limit) * np.timedelta64(30, 's'), unit='s').tolist()
+    
+    return [
+        LOG_TEMPLATES[level](stamps[i][11:19], component)
+        for i, (level, component) in enumerate(zip(levels, components))
+        if (not level_filter or level == level_filter)
+        and (not component_filter or component == component_filter)
+    ]
 
 # ========== PLUGIN HELPER FUNCTIONS ==========
 
@@ -289,24 +356,29 @@ async def generate_decision_support(options: List[Any], constraints: Dict[str, A
     if num_options == 0:
         return {"error": "No options provided for decision analysis"}
     
-    # Simulate scoring each option
-    option_scores = []
-    for i, option in enumerate(options):
-        score = random.uniform(0.4, 0.95)
-        confidence = random.uniform(0.7, 0.9)
-        option_scores.append({
+    # Simulate scoring each option, drawing every option's values at once
+    scores = _RNG.uniform(0.4, 0.95, num_options)
+    confidences = _RNG.uniform(0.7, 0.9, num_options).tolist()
+    alignments = _RNG.uniform(0.6, 0.95, num_options).tolist()
+    risks = _RNG.choice(['Low', 'Medium', 'High'], num_options).tolist()
+    outcomes = _RNG.uniform(0.5, 0.9, num_options).tolist()
+    
+    # Sort by score descending (stable, like list.sort)
+    order = np.argsort(-scores, kind="stable").tolist()
+    score_values = scores.tolist()
+    option_scores = [
+        {
             "option_index": i,
-            "score": score,
-            "confidence": confidence,
+            "score": score_values[i],
+            "confidence": confidences[i],
             "factors": [
-                f"Alignment with constraints: {random.uniform(0.6, 0.95):.1%}",
-                f"Risk assessment: {random.choice(['Low', 'Medium', 'High'])}",
-                f"Expected outcome: {random.uniform(0.5, 0.9):.1%}"
+                f"Alignment with constraints: {alignments[i]:.1%}",
+                f"Risk assessment: {risks[i]}",
+                f"Expected outcome: {outcomes[i]:.1%}"
             ]
-        })
-    
-    # Sort by score descending
-    option_scores.sort(key=lambda x: x["score"], reverse=True)
+        }
+        for i in order
+    ]
     
     result = {
         "recommended_option": option_scores[0]["option_index"],
@@ -330,8 +402,12 @@ async def generate_decision_support(options: List[Any], constraints: Dict[str, A
     return result
 
 # ========== GLOBAL STATE ==========
-query_history_store: List[QueryHistoryItem] = []
-websocket_connections: List[WebSocket] = []
+query_history_store: Deque[QueryHistoryItem] = deque(maxlen=100)  # newest first, last 100 kept
+# Each client gets its own bounded send queue, drained by a dedicated writer task
+websocket_connections: Dict[WebSocket, asyncio.Queue] = {}
+WS_SEND_QUEUE_SIZE = 4
+has_clients: Optional[asyncio.Event] = None  # set in startup_event; broadcast loop idles while nobody is connected
+STATUS_INTERVAL = 2  # seconds between status snapshots
 system_logs = []
 
 # ========== FASTAPI APP ==========
@@ -368,7 +444,7 @@ async def speak(request: SpeakRequest):
     
     # Smart responses based on keywords
     text_lower = request.text.lower()
-    if "pom" in text_lower or "voice" in text_lower:
+    if SPEAK_VOICE_RE.search(text_lower):
         response_text = (
             "For POM 2.0 voice integration, I recommend using the formant_filter module for narrator optimization "
             "and larynx_sim for character voice consistency. The phonatory modules are actively processing your "
@@ -378,40 +454,29 @@ async def speak(request: SpeakRequest):
         reasoning_path = ["perception", "skeptic_check", "knowledge_retrieval", "synthesis", "articulation"]
         skeptic_checks = 2
     else:
-        responses = [
-            "Processing through epistemic convergence matrix... Skeptic module verified logical consistency.",
-            "Multiple SKGs converged on solution with 94% confidence. Trace vault updated.",
-            "Memory consolidation queue updated. Active reasoning threads: 3",
-            "Reasoning depth: 5. Phase coherence: 0.92. Harmonic lock achieved.",
-            "Adversarial trial passed. Confidence calibrated. Ready for next query."
-        ]
-        response_text = random.choice(responses)
+        response_text = random.choice(SPEAK_RESPONSES)
         confidence = random.uniform(0.75, 0.95)
         reasoning_path = ["perceive", "analyze", "synthesize", "validate"]
         skeptic_checks = 1
     
     processing_time_ms = (time.time() - start_time) * 1000
     
-    # Store in history
-    history_item = QueryHistoryItem(
-        id=f"query_{int(time.time() * 1000)}_{random.randint(1000, 9999)}",
-        query=request.text,
-        response=response_text,
-        confidence=confidence,
-        processing_time_ms=processing_time_ms,
-        timestamp=time.time(),
-        reasoning_depth=len(reasoning_path)
-    )
-    query_history_store.insert(0, history_item)
-    
-    # Keep only last 100
-    if len(query_history_store) > 100:
-        query_history_store.pop()
+    # Store in history (fields are built right here, so skip re-validation)
+    history = {
+        "id": f"query_{secrets.token_hex(8)}",
+        "query": request.text,
+        "response": response_text,
+        "confidence": confidence,
+        "processing_time_ms": processing_time_ms,
+        "timestamp": time.time(),
+        "reasoning_depth": len(reasoning_path)
+    }
+    query_history_store.appendleft(QueryHistoryItem.model_construct(**history))
     
     # Broadcast to WebSocket clients
     await broadcast_message({
         "type": "query_processed",
-        "data": history_item.dict()
+        "data": history
     })
     
     return {
@@ -437,28 +502,13 @@ async def api_interact(request: Dict[str, Any]):
     # Generate response based on input
     text_lower = text.lower()
     
-    # Determine emotion based on content
-    if any(word in text_lower for word in ["hello", "hi", "greetings", "good morning"]):
-        emotion = "happy"
-        response_text = "Hello! I'm KayGee, your cognitive companion. How can I assist you today?"
-    elif any(word in text_lower for word in ["help", "assist", "support"]):
-        emotion = "focused"
-        response_text = "I'm here to help. I can analyze information, provide reasoning, or assist with decision-making. What would you like to explore?"
-    elif any(word in text_lower for word in ["status", "how are you", "system"]):
-        emotion = "calm"
-        response_text = "All cognitive systems are operational. Resonance levels stable at 87%. Ready for interaction."
-    elif any(word in text_lower for word in ["thank", "thanks", "appreciate"]):
-        emotion = "happy"
-        response_text = "You're welcome! I'm glad I could be of assistance."
+    # Determine emotion based on content (highest-priority intent mentioned wins)
+    intent = match_orb_intent(text_lower)
+    if intent is not None:
+        _, emotion, response_text = ORB_INTENTS[intent]
     else:
         emotion = "curious"
-        responses = [
-            "Interesting query. Let me process that through my reasoning matrix.",
-            "Analyzing your input... Multiple cognitive pathways activated.",
-            "Processing through epistemic convergence... Skeptic modules engaged.",
-            "Your question has triggered deep reasoning analysis. Stand by for response."
-        ]
-        response_text = random.choice(responses)
+        response_text = random.choice(ORB_CURIOUS_RESPONSES)
     
     confidence = random.uniform(0.85, 0.98)
     resonance = random.uniform(0.7, 0.95)
@@ -489,30 +539,45 @@ async def api_interact(request: Dict[str, Any]):
 
 @app.get("/api/cognitive/status")
 async def get_cognitive_status():
-    """Enhanced cognitive status for dashboard"""
-    return generate_cognitive_status()
+    """Enhanced cognitive status for dashboard (latest broadcast snapshot)"""
+    ensure_fresh_status_snapshot()
+    return app.state.last_cognitive
 
 @app.get("/api/health/detailed")
 async def get_health_detailed():
-    """Detailed health status for dashboard"""
-    return generate_health_status()
+    """Detailed health status for dashboard (latest broadcast snapshot)"""
+    ensure_fresh_status_snapshot()
+    return app.state.last_health
 
 @app.get("/api/health/history")
 async def get_health_history(range: str = "1h"):
     """Historical health data for trend charts"""
     return generate_health_history(range)
 
+def _result_entries(results_dir: Path, suffix: str) -> List[os.DirEntry]:
+    """Result files ending in `suffix`, from one directory scan (entries cache their stat)"""
+    try:
+        with os.scandir(results_dir) as it:
+            return [e for e in it if e.name.endswith(suffix) and not e.name.startswith('.')]
+    except FileNotFoundError:
+        return []
+
+def _write_result_file(path: Path, data: bytes):
+    """Blocking write of a result file; run in the default executor"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
 @app.get("/api/adversarial/trials")
 async def get_adversarial_trials(limit: int = 50):
     """Get adversarial trial results"""
     results_dir = Path(__file__).parent.parent / "adversarial_trial" / "results"
     try:
         # Find the latest .json file
-        json_files = list(results_dir.glob("*.json"))
+        json_files = _result_entries(results_dir, ".json")
         if json_files:
-            latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
+            latest_file = max(json_files, key=lambda e: e.stat().st_mtime)
+            loop = asyncio.get_running_loop()
+            data = orjson.loads(await loop.run_in_executor(None, Path(latest_file.path).read_bytes))
             trials = data.get("trials", [])
             # Limit if needed
             return {"trials": trials[:limit]}
@@ -528,11 +593,11 @@ async def run_adversarial(limit: int = 50):
     """Run an adversarial trial suite and persist results to adversarial_trial/results"""
     trials = generate_adversarial_trials(limit)
     results_dir = Path(__file__).parent.parent / "adversarial_trial" / "results"
+    fname = results_dir / f"run_{int(time.time())}.json"
     try:
-        results_dir.mkdir(parents=True, exist_ok=True)
-        fname = results_dir / f"run_{int(time.time())}.json"
-        with open(fname, 'w') as f:
-            json.dump({"trials": trials, "timestamp": time.time()}, f)
+        # Disk I/O off the event loop so broadcasts and other requests keep flowing
+        payload = orjson.dumps({"trials": trials, "timestamp": time.time()})
+        await asyncio.get_running_loop().run_in_executor(None, _write_result_file, fname, payload)
     except Exception as e:
         print(f"Failed to write adversarial results: {e}")
 
@@ -551,14 +616,14 @@ async def get_adversarial_summaries():
     """Get list of available adversarial trial summary files"""
     results_dir = Path(__file__).parent.parent / "adversarial_trial" / "results"
     try:
-        md_files = list(results_dir.glob("*.md"))
         summaries = []
-        for f in md_files:
+        for entry in _result_entries(results_dir, ".md"):
+            stat = entry.stat()
             summaries.append({
-                "filename": f.name,
-                "path": str(f),
-                "size": f.stat().st_size,
-                "modified": f.stat().st_mtime
+                "filename": entry.name,
+                "path": entry.path,
+                "size": stat.st_size,
+                "modified": stat.st_mtime
             })
         # Sort by modified time, newest first
         summaries.sort(key=lambda x: x["modified"], reverse=True)
@@ -577,8 +642,7 @@ async def get_adversarial_summary(filename: str):
         if not file_path.exists() or not file_path.is_file():
             raise HTTPException(status_code=404, detail="Summary file not found")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = await asyncio.get_running_loop().run_in_executor(None, partial(file_path.read_text, encoding='utf-8'))
         
         return {"filename": filename, "content": content}
     except Exception as e:
@@ -631,9 +695,11 @@ async def plugin_analyze(request: Dict[str, Any]):
         analysis_result = await perform_cognitive_analysis(content, context, analysis_type)
         
         # Broadcast analysis event to WebSocket clients
+        # One stamp for both the broadcast and the response
+        timestamp = datetime.now().isoformat()
         await broadcast_message({
             "type": "plugin_analysis",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "analysis_type": analysis_type,
             "result": analysis_result
         })
@@ -641,7 +707,7 @@ async def plugin_analyze(request: Dict[str, Any]):
         return {
             "status": "success",
             "analysis": analysis_result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     except Exception as e:
         logger.error(f"Plugin analysis error: {e}")
@@ -663,9 +729,11 @@ async def plugin_validate(request: Dict[str, Any]):
         validation_result = await perform_validation(target, criteria, validation_type)
         
         # Broadcast validation event
+        # One stamp for both the broadcast and the response
+        timestamp = datetime.now().isoformat()
         await broadcast_message({
             "type": "plugin_validation",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "validation_type": validation_type,
             "result": validation_result
         })
@@ -673,7 +741,7 @@ async def plugin_validate(request: Dict[str, Any]):
         return {
             "status": "success",
             "validation": validation_result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     except Exception as e:
         logger.error(f"Plugin validation error: {e}")
@@ -695,9 +763,11 @@ async def plugin_decision(request: Dict[str, Any]):
         decision_result = await generate_decision_support(options, constraints, decision_context)
         
         # Broadcast decision event
+        # One stamp for both the broadcast and the response
+        timestamp = datetime.now().isoformat()
         await broadcast_message({
             "type": "plugin_decision",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "options_count": len(options),
             "result": decision_result
         })
@@ -705,87 +775,117 @@ async def plugin_decision(request: Dict[str, Any]):
         return {
             "status": "success",
             "decision": decision_result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     except Exception as e:
         logger.error(f"Plugin decision error: {e}")
         return {"status": "error", "message": str(e)}
 
 # ========== WEBSOCKET ==========
+def _enqueue_message(queue: asyncio.Queue, message_json: str):
+    """Queue a message for one client, dropping its oldest pending one if it's falling behind"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message_json)
+
+async def _websocket_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """Send one client's queued messages; a slow client only delays itself"""
+    try:
+        while True:
+            await websocket.send_text(await queue.get())
+    except Exception as e:
+        print(f"Broadcast error to client: {e}")
+        _drop_client(websocket)
+
+def _drop_client(websocket: WebSocket):
+    """Forget a client; the broadcast loop idles once the last one is gone"""
+    websocket_connections.pop(websocket, None)
+    if not websocket_connections:
+        has_clients.clear()
+
 async def broadcast_message(message: Dict[str, Any]):
     """Broadcast message to all connected WebSocket clients"""
     if not websocket_connections:
         return
     
-    message_json = json.dumps(message)
-    disconnected = []
-    for ws in websocket_connections:
-        try:
-            await ws.send_text(message_json)
-        except Exception as e:
-            print(f"Broadcast error to client: {e}")
-            disconnected.append(ws)
-    
-    # Clean up disconnected clients
-    for ws in disconnected:
-        if ws in websocket_connections:
-            websocket_connections.remove(ws)
+    # orjson encodes once; keep a text frame since the dashboard JSON.parses event.data
+    message_json = orjson.dumps(message).decode()
+    for queue in websocket_connections.values():
+        _enqueue_message(queue, message_json)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
-    websocket_connections.append(websocket)
+    queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+    writer = asyncio.create_task(_websocket_writer(websocket, queue))
+    websocket_connections[websocket] = queue
+    has_clients.set()
     print(f"WS client connected. Total clients: {len(websocket_connections)}")
     # Send initial burst
-    try:
-        await websocket.send_json({
-            "type": "cognitive_update",
-            "data": {
-                "cognitive_status": generate_cognitive_status(),
-                "health_status": generate_health_status()
-            },
-            "timestamp": time.time()
-        })
-    except Exception as e:
-        print(f"Error sending initial WS message: {e}")
+    _enqueue_message(queue, orjson.dumps(cognitive_update_message()).decode())
     
     try:
         while True:
             # Keep alive
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": time.time()})
+                _enqueue_message(queue, orjson.dumps({"type": "pong", "timestamp": time.time()}).decode())
     except WebSocketDisconnect:
         print("WS client disconnected")
-        if websocket in websocket_connections:
-            websocket_connections.remove(websocket)
+    finally:
+        _drop_client(websocket)
+        writer.cancel()
 
 # ========== BACKGROUND TASKS ==========
 @app.on_event("startup")
 async def startup_event():
     """Start background broadcasting loop"""
+    global has_clients
     print(f"🚀 KayGee Backend starting on port {API_PORT}...")
+    has_clients = asyncio.Event()  # created on the serving loop (3.8/3.9 bind it at construction)
+    refresh_status_snapshot()  # REST handlers and the connect burst read it
     asyncio.create_task(broadcast_loop())
 
+def refresh_status_snapshot():
+    """Generate this tick's status, shared by the broadcast, REST handlers and connect burst"""
+    app.state.last_cognitive = generate_cognitive_status()
+    app.state.last_health = generate_health_status()
+    app.state.status_refreshed = time.monotonic()
+
+def ensure_fresh_status_snapshot():
+    """Regenerate the snapshot on demand while the broadcast loop is idle (no clients)"""
+    if time.monotonic() - app.state.status_refreshed >= STATUS_INTERVAL:
+        refresh_status_snapshot()
+
+def cognitive_update_message() -> Dict[str, Any]:
+    """Status update pushed on connect and by the broadcast loop"""
+    ensure_fresh_status_snapshot()
+    return {
+        "type": "cognitive_update",
+        "data": {
+            "cognitive_status": app.state.last_cognitive,
+            "health_status": app.state.last_health
+        },
+        "timestamp": time.time()
+    }
+
 async def broadcast_loop():
-    """Broadcast status updates every 2 seconds"""
+    """Broadcast status updates every 2 seconds while any client is connected"""
     while True:
         try:
-            await broadcast_message({
-                "type": "cognitive_update",
-                "data": {
-                    "cognitive_status": generate_cognitive_status(),
-                    "health_status": generate_health_status()
-                },
-                "timestamp": time.time()
-            })
-            await asyncio.sleep(2)
+            await has_clients.wait()
+            refresh_status_snapshot()
+            await broadcast_message(cognitive_update_message())
+            await asyncio.sleep(STATUS_INTERVAL)
         except Exception as e:
             print(f"Broadcast error: {e}")
             await asyncio.sleep(5)
 
 # ========== MAIN ==========
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=API_PORT, log_level="info")
\ No newline at end of file
+    # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build (run_backend.bat)
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="127.0.0.1", port=API_PORT, loop=loop, http="httptools", ws="websockets", log_level="info")
\ No newline at end of file
@@ -3,12 +3,19 @@ UCM Orchestrator - Unified Cognitive Manifestation
 The SOLE AUTHORITY for KayGee's presence state.
 """
 
-from typing import Dict, List
+from typing import Dict
 from fastapi import WebSocket, HTTPException
 import json
 import asyncio
 from datetime import datetime
 
+import orjson
+
+# A listener whose send takes longer than this is treated as dead
+BROADCAST_SEND_TIMEOUT = 5.0  # seconds
+# Pending updates kept per listener; presence is state, so the oldest are dropped first
+LISTENER_QUEUE_SIZE = 32
+
 class PresenceStore:
     """Single source of truth for KayGee's manifestation state"""
 
@@ -23,7 +30,9 @@ class PresenceStore:
             'reasoningPath': [],
             'lastUpdate': datetime.now().isoformat()
         }
-        self.listeners: List[WebSocket] = []
+        # Each listener has its own outbound queue, drained by a relay task
+        self.listeners: Dict[WebSocket, asyncio.Queue] = {}
+        self._relay_tasks: Dict[WebSocket, asyncio.Task] = {}
 
     def get(self):
         return self.presence.copy()
@@ -33,26 +42,40 @@ class PresenceStore:
         self.presence.update(updates)
         self.presence['lastUpdate'] = datetime.now().isoformat()
 
-        # Broadcast to all subscribers
-        update_msg = {
-            'type': 'presence_update',
-            'presence': self.presence
-        }
-
-        for ws in self.listeners[:]:
-            try:
-                asyncio.create_task(ws.send_json(update_msg))
-            except:
-                self.listeners.remove(ws)
+        # Broadcast to all subscribers: encode once (text frame, as send_json sent), then enqueue
+        if self.listeners:
+            payload = orjson.dumps({
+                'type': 'presence_update',
+                'presence': self.presence
+            }).decode()
+            for queue in self.listeners.values():
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(payload)
 
         print(f"[PresenceStore] STATE UPDATE: {updates}")
 
+    async def _relay(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Forward queued updates to one listener; a slow listener only delays itself"""
+        try:
+            while True:
+                payload = await queue.get()
+                await asyncio.wait_for(websocket.send_text(payload), timeout=BROADCAST_SEND_TIMEOUT)
+        except Exception:
+            # Dead or stuck socket: stop relaying to it
+            self.listeners.pop(websocket, None)
+            self._relay_tasks.pop(websocket, None)
+
     def subscribe(self, websocket: WebSocket):
-        self.listeners.append(websocket)
+        queue = asyncio.Queue(maxsize=LISTENER_QUEUE_SIZE)
+        self.listeners[websocket] = queue
+        self._relay_tasks[websocket] = asyncio.create_task(self._relay(websocket, queue))
 
     def unsubscribe(self, websocket: WebSocket):
-        if websocket in self.listeners:
-            self.listeners.remove(websocket)
+        self.listeners.pop(websocket, None)
+        task = self._relay_tasks.pop(websocket, None)
+        if task is not None:
+            task.cancel()
 
 # Global singleton
 presence_store = PresenceStore()
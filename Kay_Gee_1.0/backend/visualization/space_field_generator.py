@@ -12,9 +12,9 @@ Enhancements:
 https://www.primarydesignco.com
 """
 
+import functools
 import logging
 import math
-from collections.abc import Iterable
 from typing import List, Tuple, Optional, Callable, Any, Dict
 import json
 
@@ -23,10 +23,19 @@ import time
 import matplotlib
 matplotlib.use('Agg')  # Headless mode for backend
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Polygon
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.transforms import Affine2D
 
+try:
+    from scipy.fft import rfft2 as _scipy_rfft2
+
+    def _rfft2(image: np.ndarray) -> np.ndarray:
+        return _scipy_rfft2(image, workers=-1)
+except ImportError:
+    _rfft2 = np.fft.rfft2
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 colors_mapped: List[str] = [
@@ -45,20 +54,70 @@ colors_mapped: List[str] = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
+def _radial_index(height: int, width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Radius bins for an rfft2 half-spectrum of a (height, width) image.
+    Returns (integer radius per bin, mirror weight per bin, weighted bin count per radius);
+    columns 1..ceil(width/2)-1 stand in for their mirrored twins in the full spectrum.
+    Cached per canvas shape, so the arrays are returned read-only.
+    """
+    weights = np.ones(width // 2 + 1)
+    weights[1:(width + 1) // 2] = 2
+    
+    # Distance from the zero frequency, unshifted layout
+    y = np.fft.fftfreq(height, d=1 / height)[:, None]
+    x = np.arange(width // 2 + 1)[None, :]
+    r = np.sqrt(x**2 + y**2).astype(int).ravel()
+    pixel_weights = np.broadcast_to(weights, (height, width // 2 + 1)).ravel()
+    
+    nr = np.bincount(r, pixel_weights)
+    
+    pixel_weights = np.ascontiguousarray(pixel_weights)
+    for arr in (r, pixel_weights, nr):
+        arr.flags.writeable = False
+    return r, pixel_weights, nr
+
+
+def _spectral_metrics(radial_profile: np.ndarray, total_energy: float) -> Dict[str, float]:
+    """Harmonic metrics from a radial magnitude profile."""
+    return {
+        "low_freq_energy": float(np.sum(radial_profile[1:20])),
+        "high_freq_energy": float(np.sum(radial_profile[100:min(len(radial_profile), 200)])),
+        "dominant_freq": int(np.argmax(radial_profile[1:]) + 1),
+        "fractal_estimate": float(np.std(np.diff(radial_profile[:min(len(radial_profile), 100)]))),
+        "total_energy": float(total_energy),
+        "spectral_entropy": float(-np.sum(radial_profile * np.log(radial_profile + 1e-10))),
+        "radial_peak_ratio": float(np.max(radial_profile) / (np.mean(radial_profile) + 1e-10))
+    }
+
+
 class SpectralAnalyzer:
     """FFT-based spectral analysis for geometric field validation."""
     
-    def __init__(self, fig: plt.Figure, ax: plt.Axes):
+    def __init__(self, fig: plt.Figure, ax: plt.Axes, resolution: Optional[int] = None):
         self.fig = fig
         self.ax = ax
+        self.resolution = resolution  # Longest raster side for the FFT; None keeps the figure size
     
     def capture_canvas(self) -> np.ndarray:
         """Capture current plot as grayscale image."""
-        self.fig.canvas.draw()
-        data = np.frombuffer(self.fig.canvas.tostring_rgb(), dtype=np.uint8)
-        width, height = self.fig.canvas.get_width_height()
-        img = data.reshape((height, width, 3))
-        return np.mean(img, axis=2)  # Grayscale
+        canvas = self.fig.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            canvas = FigureCanvasAgg(self.fig)
+        
+        # Rasterize at the FFT resolution rather than the display dpi
+        display_dpi = self.fig.dpi
+        if self.resolution:
+            self.fig.set_dpi(self.resolution / max(self.fig.get_size_inches()))
+        try:
+            canvas.draw()
+            img = np.asarray(canvas.buffer_rgba())  # (height, width, 4) view, no copy
+            # Grayscale: channel mean accumulated in float32 (half the bytes of float64)
+            return img[..., :3].mean(axis=2, dtype=np.float32)
+        finally:
+            if self.resolution:
+                self.fig.set_dpi(display_dpi)
     
     def analyze(self) -> Dict[str, float]:
         """
@@ -67,34 +126,18 @@ class SpectralAnalyzer:
         """
         image = self.capture_canvas()
         
-        # 2D FFT
-        f = np.fft.fft2(image)
-        fshift = np.fft.fftshift(f)
-        magnitude = 20 * np.log(np.abs(fshift) + 1)
-        
-        # Radial profile (distance from center)
-        cy, cx = image.shape[0] // 2, image.shape[1] // 2
-        y, x = np.ogrid[:image.shape[0], :image.shape[1]]
-        r = np.sqrt((x - cx)**2 + (y - cy)**2)
-        r = r.astype(int)
+        # 2D FFT of a real image: only the non-redundant half (Hermitian symmetry);
+        # the float32 image stays complex64 through scipy.fft / numpy>=2
+        height, width = image.shape
+        magnitude = 20 * np.log(np.abs(_rfft2(image)) + 1)
         
-        # Average magnitude per radial distance
-        radial = np.bincount(r.ravel(), magnitude.ravel())
-        nr = np.bincount(r.ravel())
+        # Average magnitude per radial distance, as over the full spectrum
+        r, pixel_weights, nr = _radial_index(height, width)
+        weighted = magnitude.ravel() * pixel_weights
+        radial = np.bincount(r, weighted, minlength=len(nr))
         radial_profile = radial / nr
         
-        # Extract harmonic metrics
-        metrics = {
-            "low_freq_energy": float(np.sum(radial_profile[1:20])),
-            "high_freq_energy": float(np.sum(radial_profile[100:min(len(radial_profile), 200)])),
-            "dominant_freq": int(np.argmax(radial_profile[1:]) + 1),
-            "fractal_estimate": float(np.std(np.diff(radial_profile[:min(len(radial_profile), 100)]))),
-            "total_energy": float(np.sum(magnitude)),
-            "spectral_entropy": float(-np.sum(radial_profile * np.log(radial_profile + 1e-10))),
-            "radial_peak_ratio": float(np.max(radial_profile) / (np.mean(radial_profile) + 1e-10))
-        }
-        
-        return metrics
+        return _spectral_metrics(radial_profile, np.sum(weighted))
 
 
 def calculate_symmetry_point_adjusted(center: Tuple[float, float],
@@ -128,20 +171,16 @@ def multiplier(level: int, sides: int) -> float:
         return 1.5 ** (level - 2)
 
 
-def generate_vertices(center, radius, sides):
+def generate_vertices(center, radius, sides) -> np.ndarray:
     """
-    Generates vertices for a regular polygon.
+    Generates vertices for a regular polygon as a (sides, 3) array.
     For even sides, vertex0 is at angle 0, i.e. directly above the center.
     """
-    vertices = []
-    angle = (2 * math.pi) / sides
     cx, cy = center
-    for side in range(sides):
-        theta = angle * side
-        x = cx + radius * math.sin(theta)
-        y = cy + radius * math.cos(theta)
-        vertices.append((x, y, 0))
-    return vertices
+    theta = np.arange(sides) * (2 * np.pi / sides)
+    x = cx + radius * np.sin(theta)
+    y = cy + radius * np.cos(theta)
+    return np.column_stack([x, y, np.zeros(sides)])
 
 
 def midpoint(p1, p2):
@@ -165,10 +204,12 @@ def generate_base_level_polygon(
     edges_only: bool = False,
     line_width: float = 1,
     patch_registry: Optional[List] = None
-) -> List[patches.Polygon]:
-    base_level_rays: List[patches.Polygon] = []
-    polygon = patches.Polygon(vertices, closed=True, edgecolor='black' if edges_only else 'none',
-                              facecolor='none', linewidth=line_width)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Base-level ray triangles as ((B, 3, 2) vertices, (B, 4) RGBA facecolors).
+    """
+    triangles = []
+    ray_colors = []
     
     if draw_base:
         for j in range(1, (sides // 2 + 2) if sides % 2 else (sides // 2 + 1)):
@@ -180,21 +221,16 @@ def generate_base_level_polygon(
             start_vertex = vertices[i]
             middle_vertex = vertices[(i + j) % sides]
             end_vertex = vertices[(i + j - 1) % sides]
-            triangle = np.array([start_vertex, middle_vertex, end_vertex])
+            triangles.append([start_vertex[:2], middle_vertex[:2], end_vertex[:2]])
             color_index = (j - 2) % len(colors_mapped)
-            color = colors_mapped[color_index] if not edges_only else 'none'
-            base_level_ray = patches.Polygon(
-                triangle, closed=True,
-                edgecolor='black' if edges_only else 'none',
-                fill=not edges_only, facecolor=color, alpha=alpha, linewidth=line_width
-            )
-            ax.add_patch(base_level_ray)
-            base_level_rays.append(base_level_ray)
+            ray_colors.append(colors_mapped[color_index])
             
             if patch_registry is not None:
-                patch_registry.append((base_level_ray, 0, None))  # level=0, no parent
+                patch_registry.append((0, len(triangles) - 1, None))  # level=0, no parent
     
-    return base_level_rays
+    if not triangles:
+        return np.empty((0, 3, 2)), np.empty((0, 4))
+    return np.array(triangles, dtype=float), to_rgba_array(ray_colors)
 
 
 def generate_first_level_polygon(
@@ -203,32 +239,36 @@ def generate_first_level_polygon(
     center: Tuple[float, float],
     sides: int,
     alpha: float,
-    base_level_rays: List[patches.Polygon],
+    base_level_rays: Tuple[np.ndarray, np.ndarray],
     edges_only: bool = False,
     line_width: float = 1,
     patch_registry: Optional[List] = None
-) -> List[patches.Polygon]:
-    first_level_rays: List[patches.Polygon] = [base_level_rays]
-    layers = sides
-    for i in range(1, layers):
-        angle = 360 / layers * i
-        rotation = Affine2D().rotate_deg_around(center[0], center[1], angle)
-        for parent_idx, patch in enumerate(base_level_rays):
-            rotated_patch = patches.Polygon(
-                patch.get_xy(), closed=True,
-                edgecolor='black' if edges_only else 'none',
-                fill=not edges_only, facecolor=patch.get_facecolor() if not edges_only else 'none',
-                alpha=alpha, linewidth=line_width
-            )
-            rotated_patch.set_transform(rotation + ax.transData)
-            ax.add_patch(rotated_patch)
-            first_level_rays.append(rotated_patch)
-            
-            if patch_registry is not None:
-                patch_registry.append((rotated_patch, 1, parent_idx))  # level=1
-    
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First-level copies of the base rays, rotated sides-1 times about the center.
+    Returns ((sides-1) * B, V, 2) vertices and matching facecolors, angle-major.
+    """
     ax.set_aspect('equal')
-    return first_level_rays
+    base_xy, base_colors = base_level_rays
+    if not len(base_xy):
+        return base_xy, base_colors
+    
+    # All sides-1 rotations about the center as a (sides-1, 2, 2) stack
+    angles = np.deg2rad(np.arange(1, sides) * 360 / sides)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    rotations = np.stack([np.stack([cos_a, -sin_a], axis=-1),
+                          np.stack([sin_a, cos_a], axis=-1)], axis=1)
+    
+    # Rotate every base ray for every angle in one call: (sides-1, B, V, 2)
+    origin = np.asarray(center, dtype=float)
+    rotated = np.einsum('aij,bvj->abvi', rotations, base_xy - origin) + origin
+    rotated = rotated.reshape(-1, *base_xy.shape[1:])
+    
+    if patch_registry is not None:
+        base_count = len(base_xy)
+        patch_registry.extend((1, row, row % base_count) for row in range(len(rotated)))  # level=1
+    
+    return rotated, np.tile(base_colors, (sides - 1, 1))
 
 
 def generate_higher_levels(
@@ -240,59 +280,49 @@ def generate_higher_levels(
     sides: int,
     current_level: int,
     max_levels: int,
-    n_levels_rays: list,
+    n_levels_rays: Tuple[np.ndarray, np.ndarray],
     edges_only: bool = False,
     line_width: float = 1,
     cancel_callback=lambda: False,
-    patch_registry: Optional[List] = None
-) -> None:
-    if cancel_callback():
-        return
-    if current_level > max_levels or n_levels_rays[0][0].get_alpha() < 0.01:
-        return
-
-    new_level_patches = []
-
-    def process_patches(patch_list, rotation: Affine2D, accumulated_patches: list, parent_idx_base: int) -> None:
-        for patch_idx, patch in enumerate(patch_list):
-            if cancel_callback():
-                return
-            if isinstance(patch, Iterable) and not isinstance(patch, str):
-                sub_patches = []
-                process_patches(patch, rotation, sub_patches, parent_idx_base + patch_idx)
-                accumulated_patches.append(sub_patches)
-            else:
-                orig_vertices = patch.get_xy()
-                rotated_vertices = rotation.transform(orig_vertices)
-                rotated_patch = patches.Polygon(
-                    rotated_vertices, closed=True,
-                    edgecolor='black' if edges_only else 'none',
-                    fill=not edges_only,
-                    facecolor=patch.get_facecolor() if not edges_only else 'none',
-                    alpha=patch.get_alpha(), linewidth=line_width
-                )
-                ax.add_patch(rotated_patch)
-                accumulated_patches.append(rotated_patch)
-                
-                if patch_registry is not None:
-                    patch_registry.append((rotated_patch, current_level, parent_idx_base + patch_idx))
-
-    for i in range(1, sides):
-        if cancel_callback():
-            return
-        symmetry_point = calculate_symmetry_point_adjusted(center, radius, sides, current_level)
-        angle = 360 / sides * i
-        rotation = Affine2D().rotate_deg_around(symmetry_point[0], symmetry_point[1], angle)
-        process_patches(n_levels_rays, rotation, new_level_patches, 0)
+    patch_registry: Optional[List] = None,
+    alpha: float = 1.0
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Expands the rays level by level, rotating every existing ray sides-1 times
+    around the level's symmetry point. Returns one (vertices, facecolors) pair
+    per new level; each level's copies also feed the next.
+    """
+    rays_xy, rays_colors = n_levels_rays
+    new_levels = []
     
-    n_levels_rays += new_level_patches
+    for level in range(current_level, max_levels + 1):
+        if cancel_callback():
+            break
+        if not len(rays_xy) or alpha < 0.01:
+            break
+
+        symmetry_point = calculate_symmetry_point_adjusted(center, radius, sides, level)
+        # One homogeneous rotation matrix per copy: (sides-1, 3, 3)
+        rotations = np.stack([
+            Affine2D().rotate_deg_around(symmetry_point[0], symmetry_point[1], 360 / sides * i).get_matrix()
+            for i in range(1, sides)
+        ])
+
+        # Every ray's vertices as one (P, V, 3) homogeneous array, rotated in a single call
+        xy = np.concatenate([rays_xy, np.ones(rays_xy.shape[:2] + (1,))], axis=2)
+        rotated = np.einsum('kij,pvj->kpvi', rotations, xy)[..., :2].reshape(-1, *rays_xy.shape[1:])
+        colors = np.tile(rays_colors, (sides - 1, 1))
+
+        if patch_registry is not None:
+            ray_count = len(rays_xy)
+            patch_registry.extend((level, row, row % ray_count) for row in range(len(rotated)))
+
+        new_levels.append((rotated, colors))
+        rays_xy = np.concatenate([rays_xy, rotated])
+        rays_colors = np.concatenate([rays_colors, colors])
 
-    generate_higher_levels(
-        vertices, fig, ax, center, radius, sides,
-        current_level + 1, max_levels, n_levels_rays,
-        edges_only, line_width, cancel_callback, patch_registry
-    )
     fig.canvas.draw_idle()
+    return new_levels
 
 
 def calculate_effective_alpha(sides: int, levels: int, base_alpha: float = 1.0) -> float:
@@ -318,7 +348,7 @@ class SpaceFieldGenerator:
     """
     
     def __init__(self):
-        self.patch_registry = []  # Memory-safe flat list
+        self.patch_registry = []  # Memory-safe flat list of (level, row in level's vertices, parent row)
         self.spectral_analyzer = None
     
     def generate(
@@ -330,7 +360,8 @@ class SpaceFieldGenerator:
         edges_only: bool = True,
         width: int = 800,
         height: int = 800,
-        dpi: int = 100
+        dpi: int = 100,
+        spectral_resolution: Optional[int] = None
     ) -> Tuple[plt.Figure, Dict[str, Any]]:
         """
         Generate space field visualization with spectral analysis.
@@ -343,6 +374,8 @@ class SpaceFieldGenerator:
             edges_only: Show only edges (computational efficiency)
             width, height: Canvas dimensions in pixels
             dpi: Resolution
+            spectral_resolution: Longest side in pixels of the raster used for
+                the FFT (e.g. 512); defaults to the canvas size
         
         Returns:
             (figure, metrics) tuple with matplotlib figure and spectral metrics
@@ -368,54 +401,73 @@ class SpaceFieldGenerator:
         effective_alpha = calculate_effective_alpha(sides, levels, alpha)
         
         # Generate base level
-        base_patches = generate_base_level_polygon(
+        base_level = generate_base_level_polygon(
             vertices=vertices, fig=fig, ax=ax, center=center, radius=radius,
             sides=sides, alpha=effective_alpha, draw_base=True, levels=levels,
             colors_mapped=colors_mapped, edges_only=edges_only, line_width=line_width,
             patch_registry=self.patch_registry
         )
+        field_levels = [base_level]
         
-        # Generate first level expansion
-        first_level_patches = [base_patches]
+        # Generate first level expansion. Higher levels expand the base rays twice
+        # plus one unrotated base copy per first-level ray: the first-level patches
+        # used to carry their rotation as a transform, and the expansion read their
+        # untransformed vertices
+        rays = base_level
         if levels >= 1:
-            expanded_first = generate_first_level_polygon(
+            first_level = generate_first_level_polygon(
                 fig=fig, ax=ax, center=center, sides=sides, alpha=effective_alpha,
-                base_level_rays=base_patches, edges_only=edges_only, line_width=line_width,
+                base_level_rays=base_level, edges_only=edges_only, line_width=line_width,
                 patch_registry=self.patch_registry
             )
-            first_level_patches.append(expanded_first)
+            field_levels.append(first_level)
+            base_xy, base_colors = base_level
+            rays = (
+                np.concatenate([base_xy, base_xy, np.tile(base_xy, (sides - 1, 1, 1))]),
+                np.concatenate([base_colors, base_colors, first_level[1]]),
+            )
         
         # Generate higher levels
         if levels > 1:
-            generate_higher_levels(
+            field_levels.extend(generate_higher_levels(
                 vertices=vertices, fig=fig, ax=ax, center=center, radius=radius,
                 sides=sides, current_level=1, max_levels=levels,
-                n_levels_rays=first_level_patches, edges_only=edges_only,
+                n_levels_rays=rays, edges_only=edges_only,
                 line_width=line_width, cancel_callback=lambda: False,
-                patch_registry=self.patch_registry
+                patch_registry=self.patch_registry, alpha=effective_alpha
+            ))
+        
+        # One PolyCollection per level: a single artist and draw call instead of one per polygon.
+        # Miter joins match the stroke of the Polygon patches this replaced
+        collections = []
+        for xy, facecolors in field_levels:
+            if not len(xy):
+                continue
+            collection = PolyCollection(
+                xy, closed=True,
+                facecolors='none' if edges_only else facecolors,
+                edgecolors='black' if edges_only else 'none',
+                linewidths=line_width, alpha=effective_alpha, joinstyle='miter'
             )
+            ax.add_collection(collection)
+            collections.append((collection, xy))
         
-        # Apply rotation
+        # Apply rotation after the collections are added, so the data limits (and the
+        # view autoscaled from them) stay those of the unrotated field, as with patches
         if rotation_angle != 0:
-            for patch in ax.patches:
-                xy = patch.get_xy()
-                new_xy = np.zeros_like(xy)
-                radians = np.radians(rotation_angle)
-                cos_angle, sin_angle = np.cos(radians), np.sin(radians)
-                for i, (x, y) in enumerate(xy):
-                    translated_x, translated_y = x - center[0], y - center[1]
-                    rotated_x = cos_angle * translated_x - sin_angle * translated_y
-                    rotated_y = sin_angle * translated_x + cos_angle * translated_y
-                    new_xy[i, 0] = rotated_x + center[0]
-                    new_xy[i, 1] = rotated_y + center[1]
-                patch.set_xy(new_xy)
+            radians = np.radians(rotation_angle)
+            cos_angle, sin_angle = np.cos(radians), np.sin(radians)
+            rotation = np.array([[cos_angle, -sin_angle], [sin_angle, cos_angle]])
+            origin = np.asarray(center, dtype=float)
+            for collection, xy in collections:
+                collection.set_verts((xy - origin) @ rotation.T + origin, closed=True)
         
         # Set view limits
         ax.autoscale()
         plt.tight_layout()
         
         # Spectral analysis
-        self.spectral_analyzer = SpectralAnalyzer(fig, ax)
+        self.spectral_analyzer = SpectralAnalyzer(fig, ax, resolution=spectral_resolution)
         metrics = self.spectral_analyzer.analyze()
         
         # Add metadata
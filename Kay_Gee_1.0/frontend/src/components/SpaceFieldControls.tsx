@@ -59,9 +59,19 @@ export const SpaceFieldControls: React.FC = () => {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(params)
       });
-      const data = await response.json();
+      if (!response.ok) {
+        setErrorMsg(`Space field backend error: HTTP ${response.status}`);
+        return;
+      }
+      // Backend streams raw SVG (image/svg+xml); metrics travel in X-Metrics
+      const contentType = response.headers.get('Content-Type') || '';
+      if (!contentType.startsWith('image/svg+xml')) {
+        setErrorMsg(`Space field backend error: unexpected content type '${contentType}'`);
+        return;
+      }
+      const svg = await response.text();
       setErrorMsg(null);
-      setSvgContent(data.svg || '');
+      setSvgContent(svg || '');
 
       // Send resonance signature to DALS
       await sendResonanceSignature();
@@ -11,6 +11,13 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+import orjson
+
+# One block per line in the trace log; traces may carry numpy scalars/arrays
+_BLOCK_DUMP_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+# Canonical encoding hashed for merkle roots and signatures
+_HASH_DUMP_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 class VaultBase:
     """Base class for all vaults with cryptographic verification"""
@@ -346,6 +353,26 @@ class TraceVault:
     
     def append(self, transaction: Dict[str, Any]) -> str:
         """Append transaction to immutable log"""
+        block = self._chain_block(transaction)
+        
+        # Write to disk (append-only)
+        with open(self.current_log_file, 'ab') as f:
+            f.write(orjson.dumps(block, option=_BLOCK_DUMP_OPTIONS))
+        
+        return block["merkle_root"]
+    
+    def append_many(self, transactions: List[Dict[str, Any]]) -> List[str]:
+        """Append several transactions, writing all blocks in one file operation"""
+        blocks = [self._chain_block(transaction) for transaction in transactions]
+        
+        # Write to disk (append-only)
+        with open(self.current_log_file, 'ab') as f:
+            f.write(b''.join(orjson.dumps(block, option=_BLOCK_DUMP_OPTIONS) for block in blocks))
+        
+        return [block["merkle_root"] for block in blocks]
+    
+    def _chain_block(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Create, sign and chain the block for a transaction"""
         # Create block with Merkle root
         if self.blockchain:
             prev_hash = self.blockchain[-1]['merkle_root']
@@ -365,12 +392,7 @@ class TraceVault:
         block["signature"] = self._sign_block(block)
         
         self.blockchain.append(block)
-        
-        # Write to disk (append-only)
-        with open(self.current_log_file, 'a') as f:
-            f.write(json.dumps(block) + '\n')
-        
-        return block["merkle_root"]
+        return block
     
     def verify_chain(self) -> bool:
         """Verify blockchain integrity"""
@@ -398,14 +420,14 @@ class TraceVault:
     @staticmethod
     def _compute_merkle_root(transaction: Dict, prev_hash: str) -> str:
         """Compute Merkle root for block"""
-        data = json.dumps(transaction, sort_keys=True) + prev_hash
-        return hashlib.sha256(data.encode()).hexdigest()
+        data = orjson.dumps(transaction, option=_HASH_DUMP_OPTIONS) + prev_hash.encode()
+        return hashlib.sha256(data).hexdigest()
     
     @staticmethod
     def _sign_block(block: Dict) -> str:
         """Sign block with system key (placeholder)"""
-        block_data = json.dumps(block, sort_keys=True)
-        return hashlib.sha256(block_data.encode()).hexdigest()
+        block_data = orjson.dumps(block, option=_HASH_DUMP_OPTIONS)
+        return hashlib.sha256(block_data).hexdigest()
     
     def get_last_24h(self) -> List[Dict]:
         """Get all traces from last 24 hours"""
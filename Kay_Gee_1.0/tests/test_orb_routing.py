@@ -0,0 +1,48 @@
+"""Tests for the dashboard backend's orb keyword routing"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+_BACKEND_MAIN = Path(__file__).parent.parent / "backend" / "main.py"
+_spec = importlib.util.spec_from_file_location("kaygee_backend_main", _BACKEND_MAIN)
+backend_main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(backend_main)
+
+GREETING, HELP, STATUS, THANKS = range(4)
+
+
+class TestOrbKeywordRouting:
+    """Keyword routing keeps the original substring semantics and priority"""
+
+    @pytest.mark.parametrize("text, intent", [
+        ("hello there", GREETING),
+        ("good morning", GREETING),
+        ("helping", HELP),
+        ("helpful", HELP),
+        ("systems", STATUS),
+        ("statuses", STATUS),
+        ("how are you", STATUS),
+        ("thankful", THANKS),
+        ("i appreciate it", THANKS),
+    ])
+    def test_substring_matches(self, text, intent):
+        """Keywords match inside longer words, as the original `in` checks did"""
+        assert backend_main.match_orb_intent(text) == intent
+
+    @pytest.mark.parametrize("text, intent", [
+        ("thanks for the help", HELP),
+        ("system status, hello", GREETING),
+        ("this is a test", GREETING),  # "hi" inside "this"
+        ("thanksupport", HELP),  # overlapping keywords are both seen
+    ])
+    def test_priority_order(self, text, intent):
+        """The earliest intent in ORB_INTENTS wins when several are mentioned"""
+        assert backend_main.match_orb_intent(text) == intent
+
+    def test_no_keyword(self):
+        """Unmatched text falls through to the curious responses"""
+        assert backend_main.match_orb_intent("quantum entanglement") is None
@@ -0,0 +1,51 @@
+"""Tests for the SKG/UCM bridge content vectorization"""
+
+import importlib.util
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_BRIDGE = Path(__file__).parent.parent / "backend" / "POM_2.0" / "skg_ucm_bridge.py"
+_spec = importlib.util.spec_from_file_location("kaygee_skg_ucm_bridge", _BRIDGE)
+skg_ucm_bridge = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(skg_ucm_bridge)
+
+
+@pytest.fixture
+def bridge():
+    return skg_ucm_bridge.SKGUCMBridge(types.SimpleNamespace(), object())
+
+
+class TestVectorizeContent:
+    """Keyword features only count the description, whatever the title holds"""
+
+    def test_title_keywords_ignored(self, bridge):
+        """Keywords in the title do not leak into the description features"""
+        vector = bridge._vectorize_content({"title": "Quantum Amazing", "description": "plain text"})
+        assert vector[1] == 0.0
+        assert vector[2] == 0.0
+
+    @pytest.mark.parametrize("title", [None, 42, ""])
+    def test_non_string_title(self, bridge, title):
+        """A None or non-string title is formatted the same way `_lowered_text` does"""
+        metadata = {"title": title, "description": "Quantum data, amazing"}
+        vector = bridge._vectorize_content(metadata)
+        assert vector[1] == pytest.approx(2 / 5)
+        assert vector[2] == pytest.approx(1 / 3)
+
+    def test_missing_title(self, bridge):
+        vector = bridge._vectorize_content({"description": "neural sadness"})
+        assert vector[1] == pytest.approx(1 / 5)
+        assert vector[2] == pytest.approx(1 / 3)
+
+    def test_batch_matches_single(self, bridge):
+        """Row i of the batch path equals the single-record path"""
+        metadatas = [
+            {"title": None, "description": "quantum machine learning"},
+            {"title": "Terrible", "description": "a wonderful guide"},
+            {"description": ""},
+        ]
+        expected = np.stack([bridge._vectorize_content(metadata) for metadata in metadatas])
+        np.testing.assert_array_equal(bridge._vectorize_contents(metadatas), expected)
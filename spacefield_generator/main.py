@@ -106,15 +106,19 @@ class SpaceFieldGenerator:
 
     def get_svg_string(self, fig):
         """Create a simple SVG representation of the space field parameters"""
-        sides = self.current_params['sides']
-        levels = self.current_params['levels']
-        
+        return "".join(self.iter_svg(fig))
+
+    def iter_svg(self, fig):
+        """Iterate the SVG representation fragment by fragment (for streamed responses)"""
+        # Bind parameters now; the shared generator may be regenerated mid-stream
+        return self._svg_fragments(self.current_params['sides'], self.current_params['levels'])
+
+    def _svg_fragments(self, sides, levels):
         # Create a geometric pattern based on parameters
-        svg_parts = []
-        svg_parts.append('<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">')
+        yield '<svg width="400" height="400" xmlns="http://www.w3.org/2000/svg">'
         
         # Background
-        svg_parts.append('<rect width="400" height="400" fill="rgba(10, 10, 30, 0.9)"/>')
+        yield '<rect width="400" height="400" fill="rgba(10, 10, 30, 0.9)"/>'
         
         # Central pattern
         center_x, center_y = 200, 200
@@ -131,7 +135,7 @@ class SpaceFieldGenerator:
                     y = center_y + radius * math.sin(angle)
                     points.append(f"{x},{y}")
                 points_str = " ".join(points)
-                svg_parts.append(f'<polygon points="{points_str}" fill="none" stroke="rgba(74, 144, 226, {opacity})" stroke-width="2"/>')
+                yield f'<polygon points="{points_str}" fill="none" stroke="rgba(74, 144, 226, {opacity})" stroke-width="2"/>'
             
             # Add connecting lines for CC pattern
             if level > 0:
@@ -141,13 +145,11 @@ class SpaceFieldGenerator:
                     y1 = center_y + (radius - 40) * math.sin(angle)
                     x2 = center_x + radius * math.cos(angle)
                     y2 = center_y + radius * math.sin(angle)
-                    svg_parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="rgba(255, 100, 100, {opacity})" stroke-width="1"/>')
+                    yield f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="rgba(255, 100, 100, {opacity})" stroke-width="1"/>'
         
         # Add text label
-        svg_parts.append(f'<text x="200" y="380" text-anchor="middle" fill="#4a90e2" font-size="14">O{sides}CCxx{levels} Space Field</text>')
-        svg_parts.append('</svg>')
-        
-        return "".join(svg_parts)
+        yield f'<text x="200" y="380" text-anchor="middle" fill="#4a90e2" font-size="14">O{sides}CCxx{levels} Space Field</text>'
+        yield '</svg>'
 
 # Create generator instance
 generator = SpaceFieldGenerator() if VISUALIZATION_AVAILABLE else None